@@ -1,37 +1,352 @@
 import os
-import base64
+import re
+import gzip
+import struct
+import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote
 
+try:
+    from pybase64 import b64encode as _b64encode  # SIMD encoder (optional)
+except ImportError:
+    # binascii directly, skipping base64.b64encode's Python wrapper
+    from binascii import b2a_base64
+    _b64encode = functools.partial(b2a_base64, newline=False)
 
-def _load_asset(filename: str) -> str:
-    """Load a PNG file as a base64 data URI."""
-    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+# Read size for streaming encode. Must be a multiple of 3 so each chunk
+# encodes without padding and the pieces concatenate cleanly.
+_CHUNK_SIZE = 3 * 64 * 1024
+
+_ASSET_DIR = Path(__file__).resolve().parent
+_OUT_PATH = _ASSET_DIR / "proposal.html"
+
+# Rendered logo heights in px: light-slide footer (.slide-logo) and the
+# white logo on the dark slides (.logo-white / .logo-white-lg); must match _CSS
+_LOGO_HEIGHT = 20
+_LOGO_WHITE_HEIGHTS = {".logo-white": 18, ".logo-white-lg": 40}
+# Width:height of the PetDesk wordmark PNGs (~5.03 and ~5.26), used if a PNG header can't be read
+_LOGO_FALLBACK_ASPECT = 5.0
+
+# Set PROPOSAL_DEBUG=1 to keep the CSS and slide markup readable in the output
+_MINIFY = not os.environ.get("PROPOSAL_DEBUG")
+_CSS_SPACE_RE = re.compile(r"\s*([{};:,])\s*|\s+")
+# Only whitespace containing a line break between tags: indentation, never a
+# meaningful single space such as "</strong> <a>"
+_TAG_GAP_RE = re.compile(r">\s*\n\s*<")
+
+
+def _minify_css(css: str) -> str:
+    """Drop whitespace around CSS punctuation and collapse the rest."""
+    if not _MINIFY:
+        return css
+    return _CSS_SPACE_RE.sub(lambda m: m.group(1) or " ", css).strip()
+
+
+def _minify_html(html: str) -> str:
+    """Remove the source indentation between tags of a slide block."""
+    if not _MINIFY:
+        return html
+    return _TAG_GAP_RE.sub("><", html).strip()
+
+
+# Encoded data URIs persisted between runs, one file per (asset, mtime, size)
+_CACHE_DIR = _ASSET_DIR / ".cache"
+
+
+def _store_cached(filename: str, cached: Path, uri: str) -> None:
+    """Atomically write a data URI to the disk cache, dropping stale versions."""
     try:
-        with open(path, "rb") as f:
-            b64 = base64.b64encode(f.read()).decode()
-        return f"data:image/png;base64,{b64}"
+        _CACHE_DIR.mkdir(exist_ok=True)
+        tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        tmp.write_text(uri, encoding="ascii")
+        os.replace(tmp, cached)
+        for old in _CACHE_DIR.glob(f"{filename}.*.b64"):
+            if old != cached:
+                old.unlink(missing_ok=True)
+    except OSError:
+        pass  # Read-only checkout etc. - the cache is only an optimization
+
+
+def _load_asset(filename: str) -> str | None:
+    """Load a PNG file as a base64 data URI, or None if missing.
+
+    Results are cached per (filename, mtime, size), so repeated builds in one
+    process reuse the encoded string but still pick up an edited PNG.
+    """
+    try:
+        st = os.stat(_ASSET_DIR / filename)
     except FileNotFoundError:
-        return ""
+        return None
+    return _encode_asset(filename, st.st_mtime_ns, st.st_size)
+
 
+@functools.lru_cache(maxsize=None)
+def _encode_asset(filename: str, mtime_ns: int, size: int) -> str | None:
+    """Base64-encode one version of a PNG, via the .cache/ copy when present.
 
-def main():
-    # Brand assets
-    logo_uri = _load_asset("Petdesk Logo.png")  # Purple text (light backgrounds)
-    logo_white_uri = _load_asset("Petdesk Logo White Text.png")  # White text (dark backgrounds)
-    bg_purple_uri = _load_asset("Petdesk background purple.png")  # Brand purple texture
+    Encoded URIs are kept under .cache/ with the same key, so a fresh process
+    only re-encodes assets that actually changed.
+    """
+    cached = _CACHE_DIR / f"{filename}.{mtime_ns}.{size}.b64"
+    try:
+        return cached.read_text(encoding="ascii")
+    except OSError:
+        pass
+    try:
+        with open(_ASSET_DIR / filename, "rb") as f:
+            buf = bytearray(4 * ((size + 2) // 3))
+            view = memoryview(buf)
+            off = 0
+            while chunk := f.read(_CHUNK_SIZE):
+                encoded = _b64encode(chunk)
+                view[off:off + len(encoded)] = encoded
+                off += len(encoded)
+    except FileNotFoundError:
+        return None
+    uri = f"data:image/png;base64,{buf.decode('ascii')}"
+    _store_cached(filename, cached, uri)
+    return uri
+
+
+def _png_size(filename: str):
+    """(width, height) from a PNG's IHDR header, or None if unreadable."""
+    try:
+        with open(_ASSET_DIR / filename, "rb") as f:
+            head = f.read(24)
+    except OSError:
+        return None
+    if len(head) < 24 or head[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", head[16:24])
 
+
+def _asset_ref(filename: str, inline: bool = True, base: str = "") -> str | None:
+    """Return an image src for an asset: a data URI, a linked file URL, or None
+    if the PNG is missing (so callers can omit the <img> entirely).
+
+    Linked references skip base64 entirely. With the default empty `base` they
+    are relative paths, which only resolve when the PNGs sit next to the
+    generated proposal.html (as they do in this repo); pass e.g. "/static/"
+    when the PNGs are served from elsewhere.
+    """
+    if inline:
+        return _load_asset(filename)
+    path = _ASSET_DIR / filename
+    return base + quote(filename) if path.exists() else None
+
+
+# Image assets embedded in the proposal, keyed by the name the slides use
+_ASSETS = {
+    "logo": "Petdesk Logo.png",  # Purple text (light backgrounds)
+    "logo_white": "Petdesk Logo White Text.png",  # White text (dark backgrounds)
+    "bg_purple": "Petdesk background purple.png",  # Brand purple texture
     # Screenshots of the web interface
-    ss_scanner = _load_asset("screenshot_scanner.png")
-    ss_report = _load_asset("screenshot_report.png")
-    ss_history = _load_asset("screenshot_history.png")
-    ss_rules = _load_asset("screenshot_rules.png")
+    "ss_scanner": "screenshot_scanner.png",
+    "ss_report": "screenshot_report.png",
+    "ss_history": "screenshot_history.png",
+    "ss_rules": "screenshot_rules.png",
+}
+
+
+# Used on (nearly) every slide, so always worth loading up front
+_BRAND_ASSETS = ("logo", "logo_white", "bg_purple")
+
+
+class _AssetMap(dict):
+    """Image srcs keyed like _ASSETS. Missing keys are resolved on first access,
+    so a screenshot is only read and encoded if a slide actually embeds it."""
+
+    def __init__(self, inline: bool = True, base: str = ""):
+        super().__init__()
+        self.inline = inline
+        self.base = base
+
+    def __missing__(self, key: str) -> str | None:
+        src = self[key] = _asset_ref(_ASSETS[key], self.inline, self.base)
+        return src
+
+
+def load_assets(inline: bool = True, preload=_BRAND_ASSETS, base: str = "") -> _AssetMap:
+    """Return an _AssetMap with the `preload` entries already resolved.
+
+    Preloads are independent file read + encodes, so run them concurrently.
+    With inline=False the PNGs are referenced by URL (`base` + filename) instead.
+    """
+    assets = _AssetMap(inline, base)
+    if not preload:
+        return assets
+    with ThreadPoolExecutor(max_workers=len(preload)) as executor:
+        srcs = executor.map(functools.partial(_asset_ref, inline=inline, base=base),
+                            (_ASSETS[key] for key in preload))
+        assets.update(zip(preload, srcs))
+    return assets
+
+
+def main(inline: bool = True, asset_base: str = "", compress: bool = False, out=None):
+    """Regenerate proposal.html, or stream the document into `out` if given.
+
+    `out` is any binary file-like object (an open file, io.BytesIO, a
+    response stream), so callers can serve the proposal without a temp file.
+    """
+    assets = load_assets(inline, base=asset_base)
+    slides = iter_slides(assets)
+    srcs = assets["bg_purple"], assets["logo"], assets["logo_white"]
+    if out is not None:
+        write_html(out, slides, *srcs)
+        return
+
+    # Stream CSS + slides into proposal.html (or proposal.html.gz for serving
+    # with Content-Encoding: gzip); the full document is never materialized
+    # as one string
+    if compress:
+        out = _OUT_PATH.with_name(_OUT_PATH.name + ".gz")
+        f = gzip.open(out, "wb", compresslevel=6)
+    else:
+        out = _OUT_PATH
+        f = out.open("wb", buffering=1 << 20)
+    with f:
+        write_html(f, slides, *srcs)
+    print(f"Written to {out}")
+
+
+# (title, text) cards for the four-up grids on slides 2 and 6
+_PROBLEM_CARDS = (
+    ("Slow", "45–90 minutes per site, manually checking every item"),
+    ("Repetitive", "80% of checks are the same deterministic rules every time"),
+    ("Error-Prone", "Attention fatigue means issues get missed inconsistently"),
+    ("Unscalable", "More sites = more QA hours. Headcount must grow linearly."),
+)
+_HUMAN_REVIEW_CARDS = (
+    ("Brand Tone", "Subjective — requires understanding client voice"),
+    ("Image Appropriateness", "Sensitive contexts (euthanasia pages) need judgment"),
+    ("Visual Consistency", "Alignment, spacing, color matching"),
+    ("Layout & Branding", "Must match client's specific brand identity"),
+)
+
+
+def _card_grid(cards) -> str:
+    """Render (title, text) pairs as the .card blocks of a slide grid."""
+    return "".join(
+        f'''
+            <div class="card">
+                <h3 class="card-title">{title}</h3>
+                <p class="card-text">{text}</p>
+            </div>'''
+        for title, text in cards
+    )
+
+
+# (title, text) cards for the two columns on slide 16
+_LIMITATION_CARDS = (
+    ("Page Layout & Spacing", "Element alignment, margins, and section spacing require human judgment. Image cropping is handled by AI."),
+    ("Brand Tone & Voice", "Content nuance and client-specific brand voice require human review."),
+    ("Email Delivery Verification", "Form submissions are tested via Playwright, but verifying emails reach the inbox requires mailbox integration."),
+)
+_PHASE2_CARDS = (
+    ("Google Workspace SSO", "Require PetDesk Google login to access scanner &mdash; integrates with existing identity management"),
+    ("Wrike Integration", "Auto-trigger scans when Wrike tasks move to QA, attach PDF reports to the task"),
+    ("Analytics Dashboard", "Trending reports from scan history &mdash; pass rates, failure patterns, partner comparisons"),
+    ("More Partner Templates", "Expand partner-specific rules as QA team identifies unique requirements"),
+)
+
+
+def _card_stack(cards, compact: bool = False) -> str:
+    """Render (title, text) pairs as a vertical column of .card-stacked blocks."""
+    cls = "card card-stacked compact" if compact else "card card-stacked"
+    return "".join(
+        f'''
+                <div class="{cls}">
+                    <h3>{title}</h3>
+                    <p>{text}</p>
+                </div>'''
+        for title, text in cards
+    )
+
+
+# Four-week pilot plan on slide 17, one entry per week
+_WEEKS = (
+    "Shadow mode — run alongside manual QA, compare results",
+    "Tune rules based on discrepancies, target >95% agreement",
+    "Scanner-first workflow — human reviews only flagged items",
+    "Expand to Western partner",
+)
+
+
+def _week_cards(weeks) -> str:
+    """Render the numbered week cards of the pilot plan grid."""
+    return "".join(
+        f'''
+                <div class="week-card">
+                    <div class="week-num">Week {n}</div>
+                    <p>{text}</p>
+                </div>'''
+        for n, text in enumerate(weeks, 1)
+    )
+
+
+class _Template(str):
+    """Slide markup with {ss_*} fields, filled by iter_slides() via format_map.
+
+    Marked explicitly rather than detected by "{", so a literal brace in slide
+    markup (inline CSS, a code sample) can't turn a plain slide into a template.
+    """
+
+
+# Alt text for each screenshot, keyed like _ASSETS and used as the {ss_*}
+# template fields of the slides that embed them
+_SCREENSHOT_ALTS = {
+    "ss_scanner": "Scanner UI",
+    "ss_report": "QA Report",
+    "ss_rules": "Rules Viewer",
+    "ss_history": "Scan History",
+}
+
+
+class _Screenshots(dict):
+    """format_map context for the slide templates: {ss_*} -> framed screenshot
+    HTML, built on first use so each image is still only loaded if embedded."""
+
+    def __init__(self, assets: dict):
+        super().__init__()
+        self.assets = assets
+
+    def __missing__(self, key: str) -> str:
+        html = self[key] = _screenshot_html(self.assets[key], _SCREENSHOT_ALTS[key])
+        return html
+
+
+def _img(src: str | None, alt: str, style: str = "") -> str:
+    """<img> tag for an asset src, or an empty string if the image is missing."""
+    if not src:
+        return ""
+    style_attr = f' style="{style}"' if style else ""
+    return f'<img src="{src}" alt="{alt}"{style_attr} />'
 
-    slides = []
 
-    # SLIDE 1: Title slide (DARK)
-    slides.append(f'''
-    <div class="slide dark-slide" style="display: flex; flex-direction: column; align-items: center; justify-content: center; text-align: center;">
+def _screenshot_html(src: str | None, alt: str) -> str:
+    """Framed screenshot <div>, or an empty string if the image is missing."""
+    if not src:
+        return ""
+    return (
+        '<div style="border: 2px solid #e5e7eb; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">'
+        f'{_img(src, alt, "width: 100%; display: block;")}</div>'
+    )
+
+
+# Footer (page number + logo) for the light slides 2-17. The logo image itself
+# is a .slide-logo background set once in the stylesheet by write_html(), so
+# the data URI appears a single time.
+_LOGO_TAG = '<span class="slide-logo" role="img" aria-label="PetDesk Logo"></span>'
+_FOOTERS = {n: f'{_LOGO_TAG}\n        <div class="slide-num">{n}</div>' for n in range(2, 18)}
+
+
+# SLIDE 1: Title slide (DARK)
+_SLIDE_TITLE = '''
+    <div class="slide dark-slide slide-centered">
         <div class="slide-logo-wrap" style="position: absolute; top: 0.5in; left: 50%; transform: translateX(-50%); bottom: auto;">
-            <img src="{logo_white_uri or logo_uri}" alt="PetDesk Logo" />
+            <span class="logo-white" role="img" aria-label="PetDesk Logo"></span>
         </div>
         <h1 style="font-size: 44px; color: #fff; margin-bottom: 16px;">Zero-Touch QA</h1>
         <p style="font-size: 22px; color: #DDEE91; font-weight: 600; margin-bottom: 24px;">Automated Website Quality at Scale</p>
@@ -39,43 +354,28 @@ def main():
         <p style="font-size: 14px; color: rgba(255,255,255,0.6);">Hackathon Submission — Automation & AI Track</p>
         <div class="slide-num">1</div>
     </div>
-    ''')
+    '''
 
-    # SLIDE 2: The Problem
-    slides.append(f'''
+
+# SLIDE 2: The Problem
+_SLIDE_PROBLEM = f'''
     <div class="slide">
         <h2>The Problem</h2>
-        <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px; margin-bottom: 24px;">
-            <div class="card">
-                <h3 style="color: #5820BA;">Slow</h3>
-                <p style="font-size: 13px; line-height: 1.5;">45–90 minutes per site, manually checking every item</p>
-            </div>
-            <div class="card">
-                <h3 style="color: #5820BA;">Repetitive</h3>
-                <p style="font-size: 13px; line-height: 1.5;">80% of checks are the same deterministic rules every time</p>
-            </div>
-            <div class="card">
-                <h3 style="color: #5820BA;">Error-Prone</h3>
-                <p style="font-size: 13px; line-height: 1.5;">Attention fatigue means issues get missed inconsistently</p>
-            </div>
-            <div class="card">
-                <h3 style="color: #5820BA;">Unscalable</h3>
-                <p style="font-size: 13px; line-height: 1.5;">More sites = more QA hours. Headcount must grow linearly.</p>
-            </div>
+        <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 16px; margin-bottom: 24px;">{_card_grid(_PROBLEM_CARDS)}
         </div>
         <div class="callout">
-            <p style="font-size: 14px; line-height: 1.6; font-weight: 500;">80% of QA checks don't require judgment — they require verification against known rules. Machines are better at this than humans.</p>
+            <p class="lead">80% of QA checks don't require judgment — they require verification against known rules. Machines are better at this than humans.</p>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">2</div>
+        {_FOOTERS[2]}
     </div>
-    ''')
+    '''
+
 
-    # SLIDE 3: Current vs Future (COMPACT - 11px fonts)
-    slides.append(f'''
+# SLIDE 3: Current vs Future (COMPACT - 11px fonts)
+_SLIDE_CURRENT_VS_FUTURE = f'''
     <div class="slide">
         <h2>Current QA vs Zero-Touch QA</h2>
-        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
+        <div class="grid-2">
             <div>
                 <div style="background: #3C1161; color: white; padding: 6px 12px; border-radius: 4px; margin-bottom: 10px; font-weight: 600; font-size: 13px;">Current (Manual)</div>
                 <div class="flow-box">Designer completes build</div>
@@ -101,13 +401,13 @@ def main():
                 <div class="flow-box">Final sign-off</div>
             </div>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">3</div>
+        {_FOOTERS[3]}
     </div>
-    ''')
+    '''
+
 
-    # SLIDE 4: Time Savings
-    slides.append(f'''
+# SLIDE 4: Time Savings
+_SLIDE_TIME_SAVINGS = f'''
     <div class="slide">
         <h2>Projected Time Savings</h2>
         <table class="data-table" style="margin-bottom: 24px;">
@@ -124,19 +424,19 @@ def main():
                     <td>Prototype QA</td>
                     <td>~45 min/site</td>
                     <td>~5 min scan + ~10 min review</td>
-                    <td style="color: #22c55e; font-weight: 700;">~65%</td>
+                    <td class="td-good">~65%</td>
                 </tr>
                 <tr>
                     <td>Full Build QA</td>
                     <td>~90 min/site</td>
                     <td>~5 min scan + ~25 min review</td>
-                    <td style="color: #22c55e; font-weight: 700;">~67%</td>
+                    <td class="td-good">~67%</td>
                 </tr>
                 <tr>
                     <td>Final QA</td>
                     <td>~60 min/site</td>
                     <td>~5 min scan + ~15 min review</td>
-                    <td style="color: #22c55e; font-weight: 700;">~67%</td>
+                    <td class="td-good">~67%</td>
                 </tr>
             </tbody>
         </table>
@@ -154,37 +454,37 @@ def main():
                 <div class="metric-label">Work Automated</div>
             </div>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">4</div>
+        {_FOOTERS[4]}
     </div>
-    ''')
+    '''
 
-    # SLIDE 5: What Gets Automated
-    slides.append(f'''
+
+# SLIDE 5: What Gets Automated
+_SLIDE_AUTOMATED = f'''
     <div class="slide">
         <h2>What Gets Automated</h2>
-        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 14px; margin-bottom: 12px;">
-            <table class="data-table" style="font-size: 11px;">
+        <div class="grid-2-sm">
+            <table class="data-table data-table-sm">
                 <thead>
                     <tr>
-                        <th style="padding: 6px 10px;">Category</th>
-                        <th style="padding: 6px 10px;">Rules</th>
+                        <th>Category</th>
+                        <th>Rules</th>
                     </tr>
                 </thead>
                 <tbody>
-                    <tr><td style="padding: 5px 10px;">Template Text / Search-Replace</td><td style="padding: 5px 10px;">20</td></tr>
-                    <tr><td style="padding: 5px 10px;">Functionality (links, form submission, phones)</td><td style="padding: 5px 10px;">10</td></tr>
-                    <tr><td style="padding: 5px 10px;">Content, SEO &amp; Metadata</td><td style="padding: 5px 10px;">15</td></tr>
-                    <tr><td style="padding: 5px 10px;">Footer, Navigation &amp; Craftsmanship</td><td style="padding: 5px 10px;">10</td></tr>
-                    <tr><td style="padding: 5px 10px;">WordPress Backend (via plugin)</td><td style="padding: 5px 10px;">5</td></tr>
-                    <tr><td style="padding: 5px 10px;">Grammar, Spelling &amp; AI Image Analysis</td><td style="padding: 5px 10px;">2</td></tr>
-                    <tr><td style="padding: 5px 10px;">Partner-Specific Rules</td><td style="padding: 5px 10px;">38</td></tr>
+                    <tr><td>Template Text / Search-Replace</td><td>20</td></tr>
+                    <tr><td>Functionality (links, form submission, phones)</td><td>10</td></tr>
+                    <tr><td>Content, SEO &amp; Metadata</td><td>15</td></tr>
+                    <tr><td>Footer, Navigation &amp; Craftsmanship</td><td>10</td></tr>
+                    <tr><td>WordPress Backend (via plugin)</td><td>5</td></tr>
+                    <tr><td>Grammar, Spelling &amp; AI Image Analysis</td><td>2</td></tr>
+                    <tr><td>Partner-Specific Rules</td><td>38</td></tr>
                 </tbody>
             </table>
             <div>
                 <div style="background: #faf5ff; border: 1px solid #e9d5ff; border-radius: 6px; padding: 10px; margin-bottom: 10px;">
                     <h3 style="color: #5820BA; font-size: 11px; margin-bottom: 6px;">AI-Powered Checks (Gemini Vision)</h3>
-                    <ul style="font-size: 10px; line-height: 1.5; padding-left: 14px; margin: 0;">
+                    <ul class="list-xs">
                         <li>Image appropriateness on sensitive pages</li>
                         <li>Visual consistency (alignment, spacing, colors)</li>
                         <li>Responsive viewport testing (3 sizes)</li>
@@ -192,51 +492,35 @@ def main():
                         <li>Branding consistency (fonts, button colors)</li>
                     </ul>
                 </div>
-                <div style="background: #DDEE91; border-left: 3px solid #84cc16; padding: 8px 12px; border-radius: 4px; margin-bottom: 8px;">
-                    <p style="font-size: 10px; line-height: 1.4;"><strong>Result:</strong> 100 automated rules. Only 22 items need human judgment.</p>
+                <div class="note note-lime" style="margin-bottom: 8px;">
+                    <p class="t10"><strong>Result:</strong> 100 automated rules. Only 22 items need human judgment.</p>
                 </div>
-                <div style="background: #fff7ed; border-left: 3px solid #f59e0b; padding: 8px 12px; border-radius: 4px;">
-                    <p style="font-size: 10px; line-height: 1.4;"><strong>Why humans are still needed:</strong> Brand tone, visual balance, layout choices, and client-specific preferences require subjective judgment that automation cannot provide.</p>
+                <div class="note note-orange">
+                    <p class="t10"><strong>Why humans are still needed:</strong> Brand tone, visual balance, layout choices, and client-specific preferences require subjective judgment that automation cannot provide.</p>
                 </div>
             </div>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">5</div>
+        {_FOOTERS[5]}
     </div>
-    ''')
+    '''
 
-    # SLIDE 6: What Humans Still Do
-    slides.append(f'''
+
+# SLIDE 6: What Humans Still Do
+_SLIDE_HUMAN_REVIEW = f'''
     <div class="slide">
         <h2>What Humans Still Review</h2>
-        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 16px; margin-bottom: 24px;">
-            <div class="card">
-                <h3 style="color: #5820BA;">Brand Tone</h3>
-                <p style="font-size: 13px; line-height: 1.5;">Subjective — requires understanding client voice</p>
-            </div>
-            <div class="card">
-                <h3 style="color: #5820BA;">Image Appropriateness</h3>
-                <p style="font-size: 13px; line-height: 1.5;">Sensitive contexts (euthanasia pages) need judgment</p>
-            </div>
-            <div class="card">
-                <h3 style="color: #5820BA;">Visual Consistency</h3>
-                <p style="font-size: 13px; line-height: 1.5;">Alignment, spacing, color matching</p>
-            </div>
-            <div class="card">
-                <h3 style="color: #5820BA;">Layout & Branding</h3>
-                <p style="font-size: 13px; line-height: 1.5;">Must match client's specific brand identity</p>
-            </div>
+        <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 16px; margin-bottom: 24px;">{_card_grid(_HUMAN_REVIEW_CARDS)}
         </div>
         <div class="callout">
-            <p style="font-size: 14px; line-height: 1.6; font-weight: 500;">The scanner handles the tedious 80%. Humans focus on the judgment-based 20% where they add real value.</p>
+            <p class="lead">The scanner handles the tedious 80%. Humans focus on the judgment-based 20% where they add real value.</p>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">6</div>
+        {_FOOTERS[6]}
     </div>
-    ''')
+    '''
+
 
-    # SLIDE 7: How It Works (Architecture)
-    slides.append(f'''
+# SLIDE 7: How It Works (Architecture)
+_SLIDE_ARCHITECTURE = f'''
     <div class="slide">
         <h2>How It Works</h2>
         <div style="display: flex; align-items: center; justify-content: center; gap: 24px; margin: 40px 0;">
@@ -255,16 +539,16 @@ def main():
                 <div class="big-flow-subtitle">HTML report with score, failures, and checklist</div>
             </div>
         </div>
-        <div style="background: #FAF5FF; border-left: 4px solid #2DCCE8; padding: 12px 16px; border-radius: 4px; margin-top: 24px;">
+        <div class="callout callout-soft callout-teal" style="margin-top: 24px;">
             <p style="font-size: 14px; font-weight: 500;">No code knowledge needed. Open the web app, paste a URL, click Scan.</p>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">7</div>
+        {_FOOTERS[7]}
     </div>
-    ''')
+    '''
 
-    # SLIDE 8: How Users Interact
-    slides.append(f'''
+
+# SLIDE 8: How Users Interact
+_SLIDE_INTERACTION = _Template(f'''
     <div class="slide">
         <h2>How Users Interact</h2>
         <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; align-items: start;">
@@ -286,15 +570,15 @@ def main():
                     <p style="font-size: 12px; line-height: 1.6; margin: 0;">Move a Wrike task to &ldquo;QA In Progress&rdquo; &rarr; scan runs automatically &rarr; PDF report attached to the task.</p>
                 </div>
             </div>
-            {f'<div style="border: 2px solid #e5e7eb; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"><img src="{ss_scanner}" alt="Scanner UI" style="width: 100%; display: block;" /></div>' if ss_scanner else ''}
+            {{ss_scanner}}
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">8</div>
+        {_FOOTERS[8]}
     </div>
     ''')
 
-    # SLIDE 9: Live Demo Results
-    slides.append(f'''
+
+# SLIDE 9: Live Demo Results
+_SLIDE_DEMO_RESULTS = f'''
     <div class="slide">
         <h2>Live Demo: Real Scan Results</h2>
         <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 24px; margin-bottom: 20px;">
@@ -321,53 +605,53 @@ def main():
                 <p style="text-align: center; font-size: 13px; margin-top: 8px;">5 failures, 4 warnings</p>
             </div>
         </div>
-        <div style="background: #FAF5FF; border-left: 4px solid #5820BA; padding: 12px 16px; border-radius: 4px;">
+        <div class="callout callout-soft">
             <p style="font-size: 13px; font-weight: 500;">These are real scans against the provided test sites, not mock data.
             <br/>Try it live: <a href="https://zero-touch-qa.onrender.com" target="_blank" style="color: #5820BA; font-weight: 600;">zero-touch-qa.onrender.com</a></p>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">9</div>
+        {_FOOTERS[9]}
     </div>
-    ''')
+    '''
 
-    # SLIDE 10: Sample Report Preview
-    slides.append(f'''
+
+# SLIDE 10: Sample Report Preview
+_SLIDE_REPORT_PREVIEW = _Template(f'''
     <div class="slide">
         <h2>What the Report Looks Like</h2>
-        <div style="display: grid; grid-template-columns: 3fr 2fr; gap: 20px; align-items: start;">
-            {f'<div style="border: 2px solid #e5e7eb; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"><img src="{ss_report}" alt="QA Report" style="width: 100%; display: block;" /></div>' if ss_report else ''}
+        <div class="grid-3-2">
+            {{ss_report}}
             <div>
                 <div style="margin-bottom: 12px;">
-                    <div style="background: #fef2f2; border-left: 3px solid #ef4444; padding: 8px 12px; border-radius: 4px; margin-bottom: 6px;">
+                    <div class="note note-fail" style="margin-bottom: 6px;">
                         <p style="font-size: 12px; font-weight: 600; color: #dc2626;">Failures &mdash; action required</p>
                     </div>
-                    <div style="background: #fffbeb; border-left: 3px solid #f59e0b; padding: 8px 12px; border-radius: 4px; margin-bottom: 6px;">
+                    <div class="note note-warn" style="margin-bottom: 6px;">
                         <p style="font-size: 12px; font-weight: 600; color: #d97706;">Warnings &mdash; review recommended</p>
                     </div>
-                    <div style="background: #faf5ff; border-left: 3px solid #5820BA; padding: 8px 12px; border-radius: 4px; margin-bottom: 6px;">
+                    <div class="note note-brand" style="margin-bottom: 6px;">
                         <p style="font-size: 12px; font-weight: 600; color: #5820BA;">Human Review &mdash; interactive checklist</p>
                     </div>
-                    <div style="background: #f3f4f6; border-left: 3px solid #9ca3af; padding: 8px 12px; border-radius: 4px;">
+                    <div class="note note-muted">
                         <p style="font-size: 12px; font-weight: 600; color: #6b7280;">Full Breakdown &mdash; every check by category</p>
                     </div>
                 </div>
-                <div style="background: #FAF5FF; border-left: 4px solid #2DCCE8; padding: 10px 14px; border-radius: 4px;">
+                <div class="callout callout-soft callout-teal callout-sm">
                     <p style="font-size: 12px; font-weight: 500;">HTML reports: viewable in any browser, printable as PDF, shareable via link.</p>
                 </div>
             </div>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">10</div>
+        {_FOOTERS[10]}
     </div>
     ''')
 
-    # SLIDE 11: QA Rules System
-    slides.append(f'''
+
+# SLIDE 11: QA Rules System
+_SLIDE_RULES = _Template(f'''
     <div class="slide">
         <h2>How QA Rules Work</h2>
         <div style="display: grid; grid-template-columns: 2fr 3fr; gap: 20px; align-items: start;">
             <div>
-                <ul style="font-size: 12px; line-height: 1.8; padding-left: 18px; margin-bottom: 12px;">
+                <ul class="list-md">
                     <li>Rules stored in a simple data file &mdash; not buried in code</li>
                     <li>Each rule has a weight (1x&ndash;5x) that determines score impact</li>
                     <li>Different rules for different partners and build phases</li>
@@ -377,22 +661,22 @@ def main():
                     <p style="font-size: 11px; line-height: 1.5;">View, add, edit, or delete rules through the browser. No coding needed. Changes take effect on the next scan.</p>
                 </div>
             </div>
-            {f'<div style="border: 2px solid #e5e7eb; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"><img src="{ss_rules}" alt="Rules Viewer" style="width: 100%; display: block;" /></div>' if ss_rules else ''}
+            {{ss_rules}}
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">11</div>
+        {_FOOTERS[11]}
     </div>
     ''')
 
-    # SLIDE 12: WordPress Backend Checks (Plugin)
-    slides.append(f'''
+
+# SLIDE 12: WordPress Backend Checks (Plugin)
+_SLIDE_WP_CHECKS = f'''
     <div class="slide">
         <h2>WordPress Backend Checks</h2>
         <p style="font-size: 13px; line-height: 1.5; margin-bottom: 12px;">The scanner checks WordPress admin settings via the <strong>PetDesk QA Connector</strong> — a custom plugin that exposes backend data through a secure API.</p>
-        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 14px; margin-bottom: 12px;">
+        <div class="grid-2-sm">
             <div class="card" style="padding: 12px;">
                 <h3 style="color: #5820BA; margin-bottom: 6px; font-size: 13px;">What It Checks</h3>
-                <ul style="font-size: 11px; line-height: 1.6; padding-left: 16px; margin: 0;">
+                <ul class="list-sm">
                     <li>Plugin &amp; theme updates pending</li>
                     <li>Timezone matches clinic address</li>
                     <li>Old/template media in library</li>
@@ -401,7 +685,7 @@ def main():
             </div>
             <div class="card" style="padding: 12px;">
                 <h3 style="color: #22c55e; margin-bottom: 6px; font-size: 13px;">Security</h3>
-                <ul style="font-size: 11px; line-height: 1.6; padding-left: 16px; margin: 0;">
+                <ul class="list-sm">
                     <li>Single shared API key — no per-site credentials</li>
                     <li>Read-only — cannot modify site data</li>
                     <li>API key verified via secure header</li>
@@ -409,25 +693,25 @@ def main():
                 </ul>
             </div>
         </div>
-        <div style="background: #fef3c7; border-left: 4px solid #f59e0b; padding: 10px 14px; border-radius: 4px; margin-bottom: 10px;">
+        <div class="callout callout-amber callout-sm" style="margin-bottom: 10px;">
             <h3 style="color: #d97706; font-size: 12px; margin-bottom: 2px;">Action Required: Website Build Team</h3>
             <p style="font-size: 11px; line-height: 1.4;">Add to build checklist: <strong>"Install PetDesk QA Connector plugin"</strong> on every new WordPress site. Upload via WP Admin &rarr; Plugins &rarr; Add New &rarr; Upload. Without it, backend checks fall back to manual review.</p>
         </div>
         <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px;">
-            <div style="background: #ecfdf5; border-left: 3px solid #22c55e; padding: 8px 12px; border-radius: 4px;">
-                <p style="font-size: 10px; line-height: 1.4; margin: 0;"><strong style="color: #22c55e;">Auto-Updates:</strong> Plugin checks public GitHub repo for new releases and updates automatically.</p>
+            <div class="note note-success">
+                <p class="t10"><strong style="color: #22c55e;">Auto-Updates:</strong> Plugin checks public GitHub repo for new releases and updates automatically.</p>
             </div>
-            <div style="background: #FAF5FF; border-left: 3px solid #5820BA; padding: 8px 12px; border-radius: 4px;">
-                <p style="font-size: 10px; line-height: 1.4; margin: 0;"><strong style="color: #5820BA;">Fallback:</strong> Without plugin, WordPress checks appear in human review checklist.</p>
+            <div class="note note-brand">
+                <p class="t10"><strong style="color: #5820BA;">Fallback:</strong> Without plugin, WordPress checks appear in human review checklist.</p>
             </div>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">12</div>
+        {_FOOTERS[12]}
     </div>
-    ''')
+    '''
+
 
-    # SLIDE 13: Grammar & Spelling Checks
-    slides.append(f'''
+# SLIDE 13: Grammar & Spelling Checks
+_SLIDE_GRAMMAR = f'''
     <div class="slide">
         <h2>Grammar & Spelling Checks</h2>
         <p style="font-size: 14px; line-height: 1.6; margin-bottom: 16px;">The scanner automatically checks visible text on every page for grammar and spelling errors using LanguageTool (free, open-source).</p>
@@ -441,47 +725,47 @@ def main():
                 <li>Spelling = FAIL (loses points), Grammar = WARNING (no point loss)</li>
             </ul>
         </div>
-        <div style="background: #DDEE91; border-left: 4px solid #84cc16; padding: 12px 16px; border-radius: 4px;">
+        <div class="callout-lime">
             <p style="font-size: 13px; font-weight: 500; color: #3C1161;">Catches typos and misspellings while automatically allowing veterinary terminology. No false positives on medical terms.</p>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">13</div>
+        {_FOOTERS[13]}
     </div>
-    ''')
+    '''
 
-    # SLIDE 14: Scan History & Audit Trail
-    slides.append(f'''
+
+# SLIDE 14: Scan History & Audit Trail
+_SLIDE_HISTORY = _Template(f'''
     <div class="slide">
         <h2>Scan History & Audit Trail</h2>
-        <div style="display: grid; grid-template-columns: 3fr 2fr; gap: 20px; align-items: start;">
-            {f'<div style="border: 2px solid #e5e7eb; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 8px rgba(0,0,0,0.1);"><img src="{ss_history}" alt="Scan History" style="width: 100%; display: block;" /></div>' if ss_history else ''}
+        <div class="grid-3-2">
+            {{ss_history}}
             <div>
                 <p style="font-size: 13px; line-height: 1.6; margin-bottom: 12px;">Every scan is saved with its full HTML report and JSON audit trail.</p>
-                <ul style="font-size: 12px; line-height: 1.8; padding-left: 18px; margin-bottom: 12px;">
+                <ul class="list-md">
                     <li>Search by site URL or scan ID</li>
                     <li>Filter by partner, phase, or score range</li>
                     <li>Sortable columns &mdash; click any header</li>
                     <li>Score bar visualization</li>
                     <li>Direct links to full reports and JSON data</li>
                 </ul>
-                <div style="background: #FAF5FF; border-left: 4px solid #5820BA; padding: 10px 14px; border-radius: 4px;">
+                <div class="callout callout-soft callout-sm">
                     <p style="font-size: 12px; font-weight: 500;">Scan history is stored in a PostgreSQL database &mdash; persists across deploys.</p>
                 </div>
             </div>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">14</div>
+        {_FOOTERS[14]}
     </div>
     ''')
 
-    # SLIDE 15: Technology & Deployment
-    slides.append(f'''
+
+# SLIDE 15: Technology & Deployment
+_SLIDE_TECHNOLOGY = f'''
     <div class="slide">
         <h2>Technology Stack</h2>
-        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 14px; margin-bottom: 12px;">
+        <div class="grid-2-sm">
             <div class="card" style="padding: 10px 12px;">
                 <h3 style="color: #5820BA; font-size: 12px; margin-bottom: 6px;">Core Stack</h3>
-                <ul style="font-size: 10px; line-height: 1.5; padding-left: 14px; margin: 0;">
+                <ul class="list-xs">
                     <li><strong>Python 3.12</strong> + Flask web framework</li>
                     <li><strong>BeautifulSoup4</strong> for HTML parsing</li>
                     <li><strong>Playwright</strong> for headless browser testing</li>
@@ -491,7 +775,7 @@ def main():
             </div>
             <div class="card" style="padding: 10px 12px;">
                 <h3 style="color: #22c55e; font-size: 12px; margin-bottom: 6px;">External APIs</h3>
-                <ul style="font-size: 10px; line-height: 1.5; padding-left: 14px; margin: 0;">
+                <ul class="list-xs">
                     <li><strong>Gemini 2.0 Flash</strong> &mdash; AI image &amp; visual analysis</li>
                     <li><strong>LanguageTool API</strong> &mdash; Grammar/spelling (free)</li>
                     <li><strong>Nominatim/OSM</strong> &mdash; Address geocoding (free)</li>
@@ -501,131 +785,87 @@ def main():
             </div>
         </div>
         <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 10px; margin-bottom: 12px;">
-            <div style="background: #FAF5FF; border: 1px solid #e9d5ff; border-radius: 4px; padding: 8px; text-align: center;">
-                <div style="font-size: 18px; font-weight: 700; color: #5820BA;">122</div>
-                <div style="font-size: 9px; color: #6b7280;">QA Rules</div>
+            <div class="stat-tile" style="background: #FAF5FF; border-color: #e9d5ff;">
+                <div class="stat-value" style="color: #5820BA;">122</div>
+                <div class="stat-label">QA Rules</div>
             </div>
-            <div style="background: #ecfdf5; border: 1px solid #d1fae5; border-radius: 4px; padding: 8px; text-align: center;">
-                <div style="font-size: 18px; font-weight: 700; color: #22c55e;">100</div>
-                <div style="font-size: 9px; color: #6b7280;">Automated</div>
+            <div class="stat-tile" style="background: #ecfdf5; border-color: #d1fae5;">
+                <div class="stat-value" style="color: #22c55e;">100</div>
+                <div class="stat-label">Automated</div>
             </div>
-            <div style="background: #fef3c7; border: 1px solid #fde68a; border-radius: 4px; padding: 8px; text-align: center;">
-                <div style="font-size: 18px; font-weight: 700; color: #d97706;">22</div>
-                <div style="font-size: 9px; color: #6b7280;">Human Review</div>
+            <div class="stat-tile" style="background: #fef3c7; border-color: #fde68a;">
+                <div class="stat-value" style="color: #d97706;">22</div>
+                <div class="stat-label">Human Review</div>
             </div>
-            <div style="background: #ecfeff; border: 1px solid #cffafe; border-radius: 4px; padding: 8px; text-align: center;">
-                <div style="font-size: 18px; font-weight: 700; color: #0891b2;">8</div>
-                <div style="font-size: 9px; color: #6b7280;">Partners</div>
+            <div class="stat-tile" style="background: #ecfeff; border-color: #cffafe;">
+                <div class="stat-value" style="color: #0891b2;">8</div>
+                <div class="stat-label">Partners</div>
             </div>
         </div>
-        <table class="data-table" style="font-size: 10px;">
+        <table class="data-table data-table-xs">
             <thead>
                 <tr>
-                    <th style="padding: 5px 8px;">Deployment</th>
-                    <th style="padding: 5px 8px;">Hackathon</th>
-                    <th style="padding: 5px 8px;">Production</th>
+                    <th>Deployment</th>
+                    <th>Hackathon</th>
+                    <th>Production</th>
                 </tr>
             </thead>
             <tbody>
-                <tr><td style="padding: 5px 8px;">Platform</td><td style="padding: 5px 8px;">Render.com (Docker)</td><td style="padding: 5px 8px;">Google Cloud Run</td></tr>
-                <tr><td style="padding: 5px 8px;">Database</td><td style="padding: 5px 8px;">Render PostgreSQL</td><td style="padding: 5px 8px;">Cloud SQL</td></tr>
-                <tr><td style="padding: 5px 8px;">Cost</td><td style="padding: 5px 8px;">$14/mo</td><td style="padding: 5px 8px;">~$5/mo</td></tr>
-                <tr><td style="padding: 5px 8px;">Identity</td><td style="padding: 5px 8px;">Open access</td><td style="padding: 5px 8px;">Google Workspace SSO</td></tr>
+                <tr><td>Platform</td><td>Render.com (Docker)</td><td>Google Cloud Run</td></tr>
+                <tr><td>Database</td><td>Render PostgreSQL</td><td>Cloud SQL</td></tr>
+                <tr><td>Cost</td><td>$14/mo</td><td>~$5/mo</td></tr>
+                <tr><td>Identity</td><td>Open access</td><td>Google Workspace SSO</td></tr>
             </tbody>
         </table>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">15</div>
+        {_FOOTERS[15]}
     </div>
-    ''')
+    '''
+
 
-    # SLIDE 16: Limitations & Future Enhancements
-    slides.append(f'''
+# SLIDE 16: Limitations & Future Enhancements
+_SLIDE_LIMITATIONS = f'''
     <div class="slide">
         <h2>Limitations & Future Enhancements</h2>
-        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
+        <div class="grid-2">
             <div>
-                <div style="background: #f59e0b; color: white; padding: 6px 12px; border-radius: 4px; margin-bottom: 12px; font-weight: 600; font-size: 13px;">Current Limitations</div>
-                <div class="card" style="margin-bottom: 10px; font-size: 12px;">
-                    <h3 style="font-size: 13px;">Page Layout & Spacing</h3>
-                    <p style="line-height: 1.5;">Element alignment, margins, and section spacing require human judgment. Image cropping is handled by AI.</p>
-                </div>
-                <div class="card" style="margin-bottom: 10px; font-size: 12px;">
-                    <h3 style="font-size: 13px;">Brand Tone & Voice</h3>
-                    <p style="line-height: 1.5;">Content nuance and client-specific brand voice require human review.</p>
-                </div>
-                <div class="card" style="font-size: 12px;">
-                    <h3 style="font-size: 13px;">Email Delivery Verification</h3>
-                    <p style="line-height: 1.5;">Form submissions are tested via Playwright, but verifying emails reach the inbox requires mailbox integration.</p>
-                </div>
+                <div class="column-label" style="background: #f59e0b;">Current Limitations</div>{_card_stack(_LIMITATION_CARDS)}
             </div>
             <div>
-                <div style="background: #2DCCE8; color: white; padding: 6px 12px; border-radius: 4px; margin-bottom: 12px; font-weight: 600; font-size: 13px;">Phase 2 Enhancements</div>
-                <div class="card" style="margin-bottom: 8px; font-size: 12px; padding: 10px;">
-                    <h3 style="font-size: 12px;">Google Workspace SSO</h3>
-                    <p style="line-height: 1.4; font-size: 11px;">Require PetDesk Google login to access scanner &mdash; integrates with existing identity management</p>
-                </div>
-                <div class="card" style="margin-bottom: 8px; font-size: 12px; padding: 10px;">
-                    <h3 style="font-size: 12px;">Wrike Integration</h3>
-                    <p style="line-height: 1.4; font-size: 11px;">Auto-trigger scans when Wrike tasks move to QA, attach PDF reports to the task</p>
-                </div>
-                <div class="card" style="margin-bottom: 8px; font-size: 12px; padding: 10px;">
-                    <h3 style="font-size: 12px;">Analytics Dashboard</h3>
-                    <p style="line-height: 1.4; font-size: 11px;">Trending reports from scan history &mdash; pass rates, failure patterns, partner comparisons</p>
-                </div>
-                <div class="card" style="font-size: 12px; padding: 10px;">
-                    <h3 style="font-size: 12px;">More Partner Templates</h3>
-                    <p style="line-height: 1.4; font-size: 11px;">Expand partner-specific rules as QA team identifies unique requirements</p>
-                </div>
+                <div class="column-label" style="background: #2DCCE8;">Phase 2 Enhancements</div>{_card_stack(_PHASE2_CARDS, compact=True)}
             </div>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">16</div>
+        {_FOOTERS[16]}
     </div>
-    ''')
+    '''
+
 
-    # SLIDE 17: Pilot Recommendation
-    slides.append(f'''
+# SLIDE 17: Pilot Recommendation
+_SLIDE_PILOT = f'''
     <div class="slide">
         <h2>Pilot Recommendation</h2>
         <div class="callout" style="margin-bottom: 16px;">
             <p style="font-size: 14px; font-weight: 600; margin-bottom: 4px;">Start with: Express Builds, Independent Partner, Full Build Phase</p>
-            <p style="font-size: 12px; line-height: 1.5;">Highest volume, simplest rule set, longest manual QA phase</p>
+            <p class="t12">Highest volume, simplest rule set, longest manual QA phase</p>
         </div>
         <div style="margin-bottom: 16px;">
             <h3 style="font-size: 15px; margin-bottom: 10px;">4-Week Plan:</h3>
-            <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 12px;">
-                <div style="background: #faf5ff; border: 1px solid #e9d5ff; border-radius: 4px; padding: 10px;">
-                    <div style="font-weight: 700; color: #5820BA; font-size: 12px; margin-bottom: 4px;">Week 1</div>
-                    <p style="font-size: 11px; line-height: 1.4;">Shadow mode — run alongside manual QA, compare results</p>
-                </div>
-                <div style="background: #faf5ff; border: 1px solid #e9d5ff; border-radius: 4px; padding: 10px;">
-                    <div style="font-weight: 700; color: #5820BA; font-size: 12px; margin-bottom: 4px;">Week 2</div>
-                    <p style="font-size: 11px; line-height: 1.4;">Tune rules based on discrepancies, target >95% agreement</p>
-                </div>
-                <div style="background: #faf5ff; border: 1px solid #e9d5ff; border-radius: 4px; padding: 10px;">
-                    <div style="font-weight: 700; color: #5820BA; font-size: 12px; margin-bottom: 4px;">Week 3</div>
-                    <p style="font-size: 11px; line-height: 1.4;">Scanner-first workflow — human reviews only flagged items</p>
-                </div>
-                <div style="background: #faf5ff; border: 1px solid #e9d5ff; border-radius: 4px; padding: 10px;">
-                    <div style="font-weight: 700; color: #5820BA; font-size: 12px; margin-bottom: 4px;">Week 4</div>
-                    <p style="font-size: 11px; line-height: 1.4;">Expand to Western partner</p>
-                </div>
+            <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 12px;">{_week_cards(_WEEKS)}
             </div>
         </div>
-        <div style="background: #DDEE91; border-left: 4px solid #84cc16; padding: 12px 16px; border-radius: 4px;">
+        <div class="callout-lime">
             <h3 style="font-size: 13px; margin-bottom: 6px;">Success Metrics:</h3>
-            <p style="font-size: 12px; line-height: 1.5;">≥95% catch rate • <10% false positives • ≥50% time reduction • zero escapes</p>
+            <p class="t12">≥95% catch rate • <10% false positives • ≥50% time reduction • zero escapes</p>
         </div>
-        <img src="{logo_uri}" alt="PetDesk Logo" class="slide-logo" />
-        <div class="slide-num">17</div>
+        {_FOOTERS[17]}
     </div>
-    ''')
+    '''
+
 
-    # SLIDE 18: Closing (DARK)
-    slides.append(f'''
-    <div class="slide dark-slide" style="display: flex; flex-direction: column; align-items: center; justify-content: center; text-align: center;">
+# SLIDE 18: Closing (DARK)
+_SLIDE_CLOSING = '''
+    <div class="slide dark-slide slide-centered">
         <div class="slide-logo-wrap" style="position: static; margin-bottom: 24px; transform: none;">
-            <img src="{logo_white_uri or logo_uri}" alt="PetDesk Logo" style="height: 40px;" />
+            <span class="logo-white logo-white-lg" role="img" aria-label="PetDesk Logo"></span>
         </div>
         <h1 style="font-size: 36px; color: #fff; margin-bottom: 16px;">Zero-Touch QA</h1>
         <p style="font-size: 18px; color: #DDEE91; font-weight: 600; margin-bottom: 20px;">Scan smarter. Ship faster.</p>
@@ -633,17 +873,51 @@ def main():
         <p style="font-size: 13px; color: rgba(255,255,255,0.5);">Live demo: <a href="https://zero-touch-qa.onrender.com" target="_blank" id="live-url" style="color: #DDEE91; text-decoration: underline;">zero-touch-qa.onrender.com</a></p>
         <div class="slide-num">18</div>
     </div>
-    ''')
+    '''
 
-    # Write CSS + slides to proposal.html
-    html = build_html(slides, logo_uri, bg_purple_uri)
-    out = os.path.join(os.path.dirname(os.path.abspath(__file__)), "proposal.html")
-    with open(out, "w", encoding="utf-8") as f:
-        f.write(html)
-    print(f"Written to {out}")
 
-def build_html(slides, logo_uri, bg_purple_uri=""):
-    css = '''
+# Deck order. _Template slides are filled with {ss_*} screenshot fields per build;
+# every other slide is minified and encoded once here at import.
+_SLIDES = tuple(slide if isinstance(slide, _Template) else _minify_html(slide).encode() for slide in (
+    _SLIDE_TITLE,
+    _SLIDE_PROBLEM,
+    _SLIDE_CURRENT_VS_FUTURE,
+    _SLIDE_TIME_SAVINGS,
+    _SLIDE_AUTOMATED,
+    _SLIDE_HUMAN_REVIEW,
+    _SLIDE_ARCHITECTURE,
+    _SLIDE_INTERACTION,
+    _SLIDE_DEMO_RESULTS,
+    _SLIDE_REPORT_PREVIEW,
+    _SLIDE_RULES,
+    _SLIDE_WP_CHECKS,
+    _SLIDE_GRAMMAR,
+    _SLIDE_HISTORY,
+    _SLIDE_TECHNOLOGY,
+    _SLIDE_LIMITATIONS,
+    _SLIDE_PILOT,
+    _SLIDE_CLOSING,
+))
+
+
+def iter_slides(assets: dict):
+    """Yield each slide, UTF-8 encoded, from a mapping of image srcs (see _ASSETS).
+
+    Screenshots are looked up only when their slide is reached, so with an
+    _AssetMap they are loaded lazily and a streaming writer holds one slide
+    at a time.
+    """
+    shots = _Screenshots(assets)
+    for slide in _SLIDES:
+        yield slide if isinstance(slide, bytes) else _minify_html(slide.format_map(shots)).encode()
+
+
+def build_slides(assets: dict) -> list:
+    """All slides from iter_slides() as a list."""
+    return list(iter_slides(assets))
+
+
+_CSS = '''
 @import url('https://fonts.googleapis.com/css2?family=Red+Hat+Display:wght@700;900&family=DM+Sans:wght@400;500;700&display=swap');
 @page { size: 10in 5.625in; margin: 0; }
 * { margin: 0; padding: 0; box-sizing: border-box; }
@@ -653,12 +927,15 @@ body { font-family: 'DM Sans', 'Segoe UI', sans-serif; color: #3C1161; }
     page-break-after: always; overflow: hidden; background: #fff;
 }
 .slide:last-child { page-break-after: auto; }
-.slide-logo { position: absolute; bottom: 0.3in; left: 0.6in; height: 20px; }
+.slide-logo {
+    position: absolute; bottom: 0.3in; left: 0.6in; height: 20px; display: block;
+    -webkit-print-color-adjust: exact; print-color-adjust: exact;
+}
 .slide-num { position: absolute; bottom: 0.33in; right: 0.6in; font-size: 10px; color: #9ca3af; }
 h1 { font-family: 'Red Hat Display', sans-serif; font-weight: 900; }
 h2 { font-family: 'Red Hat Display', sans-serif; font-weight: 700; font-size: 24px; color: #3C1161; margin-bottom: 16px; }
 h3 { font-family: 'DM Sans', sans-serif; font-weight: 700; font-size: 14px; color: #3C1161; margin-bottom: 6px; }
-.dark-slide { background: linear-gradient(135deg, #190729, #3C1161, #5820BA); color: #fff; }
+.dark-slide { color: #fff; }
 .dark-slide h2, .dark-slide h3 { color: #fff; }
 .dark-slide .slide-num { color: rgba(255,255,255,0.3); }
 .dark-slide .slide-logo-wrap {
@@ -667,7 +944,11 @@ h3 { font-family: 'DM Sans', sans-serif; font-weight: 700; font-size: 14px; colo
     bottom: 0.3in;
     left: 0.6in;
 }
-.dark-slide .slide-logo-wrap img { height: 18px; display: block; }
+.logo-white {
+    display: block; height: 18px;
+    -webkit-print-color-adjust: exact; print-color-adjust: exact;
+}
+.logo-white-lg { height: 40px; }
 .card {
     background: #FAF5FF;
     border: 1px solid #e9d5ff;
@@ -680,6 +961,74 @@ h3 { font-family: 'DM Sans', sans-serif; font-weight: 700; font-size: 14px; colo
     padding: 14px 18px;
     border-radius: 4px;
 }
+.callout-soft { background: #FAF5FF; padding: 12px 16px; }
+.callout-amber { background: #fef3c7; border-left-color: #f59e0b; padding: 12px 16px; }
+.callout-teal { border-left-color: #2DCCE8; }
+.callout-sm { padding: 10px 14px; }
+.card-title { color: #5820BA; }
+.card-text { font-size: 13px; line-height: 1.5; }
+.card-stacked { font-size: 12px; margin-bottom: 10px; }
+.card-stacked h3 { font-size: 13px; }
+.card-stacked p { line-height: 1.5; }
+.card-stacked.compact { margin-bottom: 8px; padding: 10px; }
+.card-stacked.compact h3 { font-size: 12px; }
+.card-stacked.compact p { line-height: 1.4; font-size: 11px; }
+.card-stacked:last-child { margin-bottom: 0; }
+.column-label {
+    color: white;
+    padding: 6px 12px;
+    border-radius: 4px;
+    margin-bottom: 12px;
+    font-weight: 600;
+    font-size: 13px;
+}
+.note {
+    border-left: 3px solid;
+    padding: 8px 12px;
+    border-radius: 4px;
+}
+.note-fail { background: #fef2f2; border-color: #ef4444; }
+.note-warn { background: #fffbeb; border-color: #f59e0b; }
+.note-orange { background: #fff7ed; border-color: #f59e0b; }
+.note-brand { background: #faf5ff; border-color: #5820BA; }
+.note-muted { background: #f3f4f6; border-color: #9ca3af; }
+.note-success { background: #ecfdf5; border-color: #22c55e; }
+.note-lime { background: #DDEE91; border-color: #84cc16; }
+.week-card {
+    background: #faf5ff;
+    border: 1px solid #e9d5ff;
+    border-radius: 4px;
+    padding: 10px;
+}
+.week-card p { font-size: 11px; line-height: 1.4; }
+.week-num {
+    font-weight: 700;
+    color: #5820BA;
+    font-size: 12px;
+    margin-bottom: 4px;
+}
+.slide-centered {
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    justify-content: center;
+    text-align: center;
+}
+.grid-2 { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }
+.grid-2-sm { display: grid; grid-template-columns: 1fr 1fr; gap: 14px; margin-bottom: 12px; }
+.grid-3-2 { display: grid; grid-template-columns: 3fr 2fr; gap: 20px; align-items: start; }
+.lead { font-size: 14px; line-height: 1.6; font-weight: 500; }
+.t12 { font-size: 12px; line-height: 1.5; }
+.t10 { font-size: 10px; line-height: 1.4; }
+.list-md { font-size: 12px; line-height: 1.8; padding-left: 18px; margin-bottom: 12px; }
+.list-sm { font-size: 11px; line-height: 1.6; padding-left: 16px; }
+.list-xs { font-size: 10px; line-height: 1.5; padding-left: 14px; }
+.callout-lime {
+    background: #DDEE91;
+    border-left: 4px solid #84cc16;
+    padding: 12px 16px;
+    border-radius: 4px;
+}
 .flow-box {
     background: #FAF5FF;
     border: 1px solid #c4b5fd;
@@ -734,6 +1083,20 @@ h3 { font-family: 'DM Sans', sans-serif; font-weight: 700; font-size: 14px; colo
 .data-table tbody tr:nth-child(even) {
     background: #fafafa;
 }
+.data-table-sm { font-size: 11px; }
+.data-table-sm th { padding: 6px 10px; }
+.data-table-sm td { padding: 5px 10px; }
+.data-table-xs { font-size: 10px; }
+.data-table-xs th, .data-table-xs td { padding: 5px 8px; }
+.td-good { color: #22c55e; font-weight: 700; }
+.stat-tile {
+    border: 1px solid;
+    border-radius: 4px;
+    padding: 8px;
+    text-align: center;
+}
+.stat-value { font-size: 18px; font-weight: 700; }
+.stat-label { font-size: 9px; color: #6b7280; }
 .metric-box {
     background: linear-gradient(135deg, #faf5ff, #f3e8ff);
     border: 2px solid #5820BA;
@@ -802,29 +1165,76 @@ h3 { font-family: 'DM Sans', sans-serif; font-weight: 700; font-size: 14px; colo
 }
 '''
 
-    # Replace dark slide gradient with brand texture if available
-    if bg_purple_uri:
-        css = css.replace(
-            "background: linear-gradient(135deg, #190729, #3C1161, #5820BA);",
-            f"background: url('{bg_purple_uri}') center/cover no-repeat;"
-        )
-
-    slides_html = '\n'.join(slides)
+# Minified once at import; write_html() emits these bytes as-is.
+_CSS_BYTES = _minify_css(_CSS).encode()
 
-    return f'''<!DOCTYPE html>
+# Fixed document chrome around the per-run dark-slide rule and the slides.
+_HTML_HEAD = b'''<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
 <title>Zero-Touch QA - Hackathon Proposal</title>
 <style>
-{css}
+''' + _CSS_BYTES
+_HTML_BODY_OPEN = b'''
 </style>
 </head>
 <body>
-{slides_html}
+'''
+_HTML_SUFFIX = b'''
 </body>
 </html>'''
 
+
+def _logo_width(key: str, height: int) -> float:
+    """Width in px that keeps an _ASSETS logo's aspect ratio at `height`.
+
+    The logos are width-less spans sized only by this rule, so an unreadable PNG
+    header falls back to the wordmark's usual aspect ratio rather than 0px.
+    """
+    size = _png_size(_ASSETS[key])
+    aspect = size[0] / size[1] if size else _LOGO_FALLBACK_ASPECT
+    return round(height * aspect, 1)
+
+
+def write_html(f, slides, bg_purple_uri=None, logo_uri=None, logo_white_uri=None):
+    """Write the proposal document (CSS + encoded slides) to a binary file handle.
+
+    The logos are emitted once, as CSS backgrounds: `logo_uri` for every
+    .slide-logo footer, `logo_white_uri` (falling back to `logo_uri`) for the
+    .logo-white elements on the dark slides.
+    """
+    # Dark slides use the brand texture when available, else a gradient.
+    # Emitted as its own rule so the CSS text never needs rewriting.
+    if bg_purple_uri:
+        dark_bg = f"url('{bg_purple_uri}') center/cover no-repeat"
+    else:
+        dark_bg = "linear-gradient(135deg, #190729, #3C1161, #5820BA)"
+
+    f.write(_HTML_HEAD)
+    f.write(f'.dark-slide {{ background: {dark_bg}; }}'.encode())
+    if logo_uri:
+        width = _logo_width("logo", _LOGO_HEIGHT)
+        f.write(f".slide-logo {{ width: {width}px; background: url('{logo_uri}') left center / contain no-repeat; }}".encode())
+    white_key = "logo_white" if logo_white_uri else "logo"
+    if logo_white_uri or logo_uri:
+        f.write(f".logo-white {{ background: url('{logo_white_uri or logo_uri}') center / contain no-repeat; }}".encode())
+        for selector, height in _LOGO_WHITE_HEIGHTS.items():
+            f.write(f" {selector} {{ width: {_logo_width(white_key, height)}px; }}".encode())
+    f.write(_HTML_BODY_OPEN)
+    f.writelines(slides)
+    f.write(_HTML_SUFFIX)
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Regenerate proposal.html")
+    parser.add_argument("--linked", action="store_true",
+                        help="Reference the PNGs by relative path instead of embedding them as base64 "
+                             "(smaller file, but the PNGs must stay next to proposal.html)")
+    parser.add_argument("--asset-base", default="", metavar="URL",
+                        help="URL prefix for linked PNGs, e.g. /static/ (implies --linked)")
+    parser.add_argument("--gzip", action="store_true",
+                        help="Write a gzip-compressed proposal.html.gz instead")
+    args = parser.parse_args()
+    main(inline=not (args.linked or args.asset_base), asset_base=args.asset_base,
+         compress=args.gzip)
@@ -0,0 +1,100 @@
+"""
+Zero-Touch QA - PNG asset optimizer
+Shrinks the brand and screenshot PNGs that _build_proposal.py embeds, so every
+later base64 encode and proposal.html carries fewer bytes:
+
+  1. Downscale anything wider/taller than MAX_DIM (needs Pillow; the slides
+     never render an image above ~1600px even at 2x density)
+  2. Lossy palette quantization with `pngquant` (only with --lossy)
+  3. Lossless recompression with `oxipng`
+
+Each step is skipped if its tool is missing. Run once after adding or
+replacing a PNG, then commit the smaller files:
+    python _optimize_assets.py [--lossy]
+"""
+
+import os
+import shutil
+import argparse
+import subprocess
+
+try:
+    from PIL import Image
+    _HAS_PIL = True
+except ImportError:
+    _HAS_PIL = False
+
+from _build_proposal import _ASSETS, _ASSET_DIR
+
+# Largest rendered size of any proposal image, doubled for high-DPI screens
+MAX_DIM = 1600
+
+
+def downscale_png(path: str, max_dim: int = MAX_DIM) -> bool:
+    """Resize in place so neither side exceeds max_dim. Returns True if resized."""
+    with Image.open(path) as img:
+        if max(img.size) <= max_dim:
+            return False
+        img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
+        img.save(path, optimize=True)
+    return True
+
+
+def quantize_png(path: str, pngquant: str) -> None:
+    """Reduce to a palette in place, keeping the original if quality or size would suffer."""
+    # Exit 99 = quality below 65, 98 = result not smaller; both leave the file as-is
+    result = subprocess.run([pngquant, "--quality", "65-85", "--skip-if-larger", "--force",
+                             "--ext", ".png", path])
+    if result.returncode not in (0, 98, 99):
+        result.check_returncode()
+
+
+def optimize_png(path: str, oxipng: str) -> tuple[int, int]:
+    """Recompress one PNG in place. Returns (size_before, size_after)."""
+    before = os.path.getsize(path)
+    subprocess.run([oxipng, "-o", "4", "--strip", "safe", "--quiet", path], check=True)
+    return before, os.path.getsize(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shrink the PNGs embedded in proposal.html")
+    parser.add_argument("--lossy", action="store_true",
+                        help="Also quantize with pngquant (smaller, but not pixel-identical)")
+    args = parser.parse_args()
+
+    oxipng = shutil.which("oxipng")
+    pngquant = shutil.which("pngquant") if args.lossy else None
+    if not _HAS_PIL:
+        print("Pillow not installed - skipping downscale")
+    if args.lossy and not pngquant:
+        print("pngquant not found on PATH - skipping quantization")
+    if not oxipng:
+        print("oxipng not found on PATH - skipping lossless recompression")
+    if not (_HAS_PIL or pngquant or oxipng):
+        return
+
+    total_before = total_after = 0
+    for filename in _ASSETS.values():
+        path = os.path.join(_ASSET_DIR, filename)
+        if not os.path.exists(path):
+            print(f"  skip {filename} (missing)")
+            continue
+        before = os.path.getsize(path)
+        if _HAS_PIL and downscale_png(path):
+            print(f"  {filename}: downscaled to fit {MAX_DIM}px")
+        if pngquant:
+            quantize_png(path, pngquant)
+        if oxipng:
+            optimize_png(path, oxipng)
+        after = os.path.getsize(path)
+        total_before += before
+        total_after += after
+        print(f"  {filename}: {before // 1024} KB -> {after // 1024} KB")
+
+    if total_before:
+        saved = 100 * (total_before - total_after) / total_before
+        print(f"Saved {(total_before - total_after) // 1024} KB ({saved:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,39 +7,117 @@ Flask web app that provides:
 """
 
 import gc
+import gzip
 import json
+import mmap
 import os
+import re
 import time
 import base64
+import sqlite3
+import hashlib
+import functools
 import threading
+import uuid
 import psutil
+import requests
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from dotenv import load_dotenv
-from flask import Flask, request, jsonify, render_template_string, send_from_directory, Response
-
-from qa_rules import get_rules_for_scan, get_automatable_rules, get_human_review_rules, get_all_rules, get_partner_rule_map, _save_rules
+from flask import Flask, request, jsonify, render_template, send_from_directory, Response
+from flask.json.provider import DefaultJSONProvider
+from markupsafe import Markup, escape
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode
+
+from qa_rules import get_rules_for_scan, get_automatable_rules, get_human_review_rules, get_all_rules, get_partner_rule_map, _save_rules, _rules_mtime
 from qa_scanner import SiteCrawler, ScanReport, CheckResult, CHECK_FUNCTIONS, cleanup_shared_browser, clear_psi_cache, pre_extract_page_data, clear_pre_extracted_data, clear_ai_caches, _psi_failed_urls, run_psi_playwright_fallback
 from qa_report import generate_html_report, generate_wrike_comment, generate_json_report
 from wp_api import PetDeskQAPluginClient, WordPressAPIClient, WP_CHECK_FUNCTIONS
 from db import is_db_available, init_db, db_get_scan_id, db_save_scan, \
     db_load_scan_history, db_get_report, db_seed_from_filesystem
 
+# Optional: orjson for faster JSON responses and report files
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Optional: Brotli for cached reports, Flask-Compress for other dynamic responses
+try:
+    import brotli
+    _HAS_BROTLI = True
+except ImportError:
+    _HAS_BROTLI = False
+
+try:
+    from flask_compress import Compress
+    _HAS_FLASK_COMPRESS = True
+except ImportError:
+    _HAS_FLASK_COMPRESS = False
+
 load_dotenv()  # Loads .env file automatically
 
 app = Flask(__name__)
 
+if _HAS_ORJSON:
+    # Datetimes go through Flask's own default() so responses match the stdlib provider
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    class OrjsonProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson (same output as the default, faster)."""
+
+        def dumps(self, obj, **kwargs):
+            option = _ORJSON_OPTS | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
+
+if _HAS_FLASK_COMPRESS:
+    # Responses that already set Content-Encoding (home page, cached reports) are
+    # left alone; streams stay uncompressed so scan progress events arrive live.
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"] if _HAS_BROTLI else ["gzip"]
+    app.config["COMPRESS_LEVEL"] = 5
+    app.config["COMPRESS_BR_LEVEL"] = 5
+    app.config["COMPRESS_MIN_SIZE"] = 1024
+    app.config["COMPRESS_STREAMS"] = False
+    Compress(app)
+
+
+# orjson parses straight from bytes; json.loads accepts bytes too
+_loads_json = orjson.loads if _HAS_ORJSON else json.loads
+
+
+def _write_json_report(path: str, data: dict):
+    """Write a JSON audit report, indented, with non-JSON values stringified."""
+    if _HAS_ORJSON:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, default=str, option=_ORJSON_OPTS | orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, default=str)
+
 # ---------------------------------------------------------------------------
 # PetDesk brand assets (base64 for embedding in HTML)
 # ---------------------------------------------------------------------------
 _ASSETS_DIR = os.path.dirname(__file__)
 
 
+@functools.lru_cache(maxsize=None)
 def _load_asset(filename: str) -> str:
+    # mmap lets b64encode read the file's pages directly (no bytes copy)
     try:
-        with open(os.path.join(_ASSETS_DIR, filename), "rb") as f:
-            return f"data:image/png;base64,{base64.b64encode(f.read()).decode()}"
-    except FileNotFoundError:
+        with open(os.path.join(_ASSETS_DIR, filename), "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return f"data:image/png;base64,{base64.b64encode(mm).decode('ascii')}"
+    except (FileNotFoundError, ValueError):  # ValueError: empty file can't be mapped
         return ""
 
 
@@ -47,6 +125,9 @@ LOGO_DATA_URI = _load_asset("Petdesk Logo.png")  # Purple text (white bg)
 LOGO_WHITE_URI = _load_asset("Petdesk Logo White Text.png")  # White text (dark bg)
 BG_PURPLE_URI = _load_asset("Petdesk background purple.png")  # Brand texture
 
+# Template variables shared by every branded page
+ASSET_CONTEXT = {"logo_uri": LOGO_DATA_URI, "logo_white_uri": LOGO_WHITE_URI, "bg_purple_uri": BG_PURPLE_URI}
+
 # ---------------------------------------------------------------------------
 # Config - loaded from .env file
 # ---------------------------------------------------------------------------
@@ -58,26 +139,42 @@ WRIKE_CUSTOM_FIELD_PHASE = os.environ.get("WRIKE_CF_PHASE", "")           # cust
 # PetDesk QA Plugin API key (shared across all sites with the plugin installed)
 PETDESK_QA_API_KEY = os.environ.get("PETDESK_QA_API_KEY", "petdesk-qa-2026-hackathon-key")
 
-# Store scan history in memory (backed by PostgreSQL when DATABASE_URL is set)
+# Store scan history in memory (backed by PostgreSQL when DATABASE_URL is set).
+# Guarded by _history_lock now that gunicorn serves requests on several threads.
 scan_history = []
+_history_lock = threading.Lock()
 
 # Limit concurrent scans to 1 to stay within Render.com 512MB memory limit
 _scan_semaphore = threading.Semaphore(1)
 
+# check_fn name -> (function, takes wp_client), built once instead of two lookups per rule
+_CHECK_DISPATCH = {name: (fn, name in WP_CHECK_FUNCTIONS) for name, fn in CHECK_FUNCTIONS.items()}
+
+# Worker threads for the parallel (non-browser) checks. Most are I/O-bound
+# HTTP calls; raise on hosts with more memory headroom than Render's 512MB.
+QA_RULE_WORKERS = max(1, int(os.environ.get("QA_RULE_WORKERS", "4")))
+
 
 def _add_to_scan_history(entry: dict):
-    """Add a scan to in-memory history, replacing any existing entry with the same scan_id."""
+    """Add a scan to in-memory history, replacing any existing entry with the same scan_id.
+
+    Builds a new list rather than editing in place: with a database, scan_history
+    is the list cached by db_load_scan_history.
+    """
+    global scan_history
     scan_id = entry.get("scan_id")
-    if scan_id:
-        scan_history[:] = [s for s in scan_history if s.get("scan_id") != scan_id]
-    scan_history.append(entry)
-    if len(scan_history) > 200:
-        scan_history[:] = scan_history[-200:]
+    with _history_lock:
+        history = [s for s in scan_history if not scan_id or s.get("scan_id") != scan_id]
+        history.append(entry)
+        scan_history = history[-200:]
 
 REPORTS_DIR = os.path.join(os.path.dirname(__file__), "reports")
 os.makedirs(REPORTS_DIR, exist_ok=True)
 
-_SCAN_COUNTER_FILE = os.path.join(REPORTS_DIR, "scan_counter.json")
+_SCAN_COUNTER_FILE = os.path.join(REPORTS_DIR, "scan_counter.json")  # legacy, imported once
+_SCAN_COUNTER_DB = os.path.join(REPORTS_DIR, "scan_counter.sqlite")
+_counter_conn: sqlite3.Connection | None = None
+_counter_lock = threading.Lock()
 
 # Initialize database (creates tables if needed, no-op if no DATABASE_URL)
 init_db()
@@ -98,29 +195,58 @@ def _get_scan_id(site_url: str, phase: str) -> str:
     except Exception as e:
         print(f"[DB] Error getting scan ID, falling back to filesystem: {e}")
 
-    # Fallback: filesystem
-    try:
-        with open(_SCAN_COUNTER_FILE, "r") as f:
-            data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        data = {}
-
-    next_num = data.get("next_id", 1)
-    mapping = data.get("mapping", {})
-
+    # Fallback: local SQLite counter (point update under a write lock, safe across workers)
     key = f"{site_url}|{phase}"
-    if key in mapping:
-        return mapping[key]
-
-    scan_id = f"QA-{next_num:04d}"
-    mapping[key] = scan_id
-    data["next_id"] = next_num + 1
-    data["mapping"] = mapping
-    with open(_SCAN_COUNTER_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    with _counter_lock:
+        conn = _get_counter_db()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT scan_id FROM scan_ids WHERE key = ?", (key,)).fetchone()
+            if row:
+                scan_id = row[0]
+            else:
+                next_num = conn.execute("SELECT v FROM meta WHERE k = 'next_id'").fetchone()[0]
+                scan_id = f"QA-{next_num:04d}"
+                conn.execute("INSERT INTO scan_ids (key, scan_id) VALUES (?, ?)", (key, scan_id))
+                conn.execute("UPDATE meta SET v = ? WHERE k = 'next_id'", (next_num + 1,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
     return scan_id
 
 
+def _get_counter_db() -> sqlite3.Connection:
+    """Open the local scan ID store on first use, importing scan_counter.json if present."""
+    global _counter_conn
+    if _counter_conn is not None:
+        return _counter_conn
+
+    conn = sqlite3.connect(_SCAN_COUNTER_DB, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS scan_ids (key TEXT PRIMARY KEY, scan_id TEXT NOT NULL)")
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v INTEGER NOT NULL)")
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("SELECT 1 FROM meta WHERE k = 'next_id'").fetchone() is None:
+            try:
+                with open(_SCAN_COUNTER_FILE, "r") as f:
+                    data = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                data = {}
+            conn.executemany("INSERT OR IGNORE INTO scan_ids (key, scan_id) VALUES (?, ?)",
+                             data.get("mapping", {}).items())
+            conn.execute("INSERT INTO meta (k, v) VALUES ('next_id', ?)", (data.get("next_id", 1),))
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+    _counter_conn = conn
+    return conn
+
+
 # ---------------------------------------------------------------------------
 # Core scan engine (shared between web UI and Wrike webhook)
 # ---------------------------------------------------------------------------
@@ -169,7 +295,8 @@ def run_scan(site_url: str, partner: str, phase: str, max_pages: int = 30, progr
     check_errors = []  # Track checks that fell back to HUMAN_REVIEW due to errors
 
     # Check WP plugin BEFORE crawl — the crawl can trigger hosting rate-limits
-    # which would cause the plugin endpoint to return 503 (false "not detected")
+    # which would cause the plugin endpoint to return 503 (false "not detected").
+    # The probe's 429/503 retry backoff hits the same host, so it must not overlap the crawl.
     progress("wordpress", "Checking WordPress backend...")
     wp_client = PetDeskQAPluginClient(site_url, PETDESK_QA_API_KEY)
     if not wp_client.is_available():
@@ -191,8 +318,6 @@ def run_scan(site_url: str, partner: str, phase: str, max_pages: int = 30, progr
     crawler._cleanup_browser()  # Release browser reference before checks
 
     # Run checks: fast checks in parallel, Playwright checks sequentially
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     all_results = []
 
     # Only checks that actually use Playwright (browser) go here
@@ -209,17 +334,17 @@ def run_scan(site_url: str, partner: str, phase: str, max_pages: int = 30, progr
 
     def run_check(rule):
         """Run a single check and return results."""
-        fn_name = rule.get("check_fn")
-        if not fn_name or fn_name not in CHECK_FUNCTIONS:
+        entry = _CHECK_DISPATCH.get(rule.get("check_fn"))
+        if entry is None:
             return [CheckResult(
                 rule_id=rule["id"], category=rule["category"],
                 check=rule["check"], status="HUMAN_REVIEW", weight=rule["weight"],
                 details="Automated check not yet implemented. Verify manually.",
             )]
 
-        fn = CHECK_FUNCTIONS[fn_name]
+        fn, needs_wp = entry
         try:
-            if fn_name in WP_CHECK_FUNCTIONS:
+            if needs_wp:
                 return fn(pages, rule, wp_client=wp_client)
             else:
                 return fn(pages, rule)
@@ -234,10 +359,10 @@ def run_scan(site_url: str, partner: str, phase: str, max_pages: int = 30, progr
     # 1. Run fast checks in parallel (no Playwright)
     progress("checks", f"Running {len(parallel_rules)} fast checks in parallel...")
     _mem_mb("Before parallel checks")
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {executor.submit(run_check, rule): rule for rule in parallel_rules}
-        for future in as_completed(futures):
-            all_results.extend(future.result())
+    # map() keeps results in rule order, so reports are stable between runs
+    with ThreadPoolExecutor(max_workers=QA_RULE_WORKERS) as executor:
+        for results in executor.map(run_check, parallel_rules):
+            all_results.extend(results)
     _mem_mb("After parallel checks")
 
     # Pre-extract data that browser checks need, then free ALL soups (~60MB savings).
@@ -300,7 +425,10 @@ def run_scan(site_url: str, partner: str, phase: str, max_pages: int = 30, progr
 
     progress("report", "Generating report...")
 
-    # Apply penalties: failures lose full weight, warnings 50%, pending human reviews 30%
+    # Apply penalties: failures lose full weight, warnings 50%, pending human reviews 30%.
+    # Tally statuses and points in the same pass.
+    status_counts = Counter()
+    total_points_lost = 0
     for r in all_results:
         if r.status == "FAIL":
             r.points_lost = r.weight
@@ -308,8 +436,9 @@ def run_scan(site_url: str, partner: str, phase: str, max_pages: int = 30, progr
             r.points_lost = r.weight * 0.5
         elif r.status == "HUMAN_REVIEW":
             r.points_lost = r.weight * 0.3
+        status_counts[r.status] += 1
+        total_points_lost += r.points_lost
 
-    total_points_lost = sum(r.points_lost for r in all_results)
     score = round(max(0, 100 - total_points_lost))
 
     # Collect check errors into scan issues
@@ -337,10 +466,10 @@ def run_scan(site_url: str, partner: str, phase: str, max_pages: int = 30, progr
         site_url=site_url, partner=partner, phase=phase,
         scan_time=datetime.now().isoformat(),
         pages_scanned=len(pages), total_checks=len(all_results),
-        passed=sum(1 for r in all_results if r.status == "PASS"),
-        failed=sum(1 for r in all_results if r.status == "FAIL"),
-        warnings=sum(1 for r in all_results if r.status == "WARN"),
-        human_review=sum(1 for r in all_results if r.status == "HUMAN_REVIEW"),
+        passed=status_counts["PASS"],
+        failed=status_counts["FAIL"],
+        warnings=status_counts["WARN"],
+        human_review=status_counts["HUMAN_REVIEW"],
         score=score, results=all_results,
         scan_issues=scan_issues,
     )
@@ -351,15 +480,28 @@ def run_scan(site_url: str, partner: str, phase: str, max_pages: int = 30, progr
 # Wrike API helpers
 # ---------------------------------------------------------------------------
 
+# One pooled session for all Wrike calls: keep-alive skips a TCP+TLS handshake per
+# request. Status and read retries only cover idempotent methods, so a comment POST
+# is never sent twice; connect errors (nothing sent yet) are retried for every method.
+# raise_on_status=False returns the last 429/5xx response once retries run out instead
+# of raising RetryError, so callers still see the status code as before.
+_WRIKE_SESSION = requests.Session()
+_WRIKE_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504),
+                      raise_on_status=False),
+))
+_WRIKE_TIMEOUT = (5, 15)  # (connect, read) seconds
+_WRIKE_ID_RE = re.compile(r"[^a-zA-Z0-9_-]")
+
+
 def _sanitize_wrike_id(task_id: str) -> str:
     """Sanitize a Wrike task ID to prevent URL injection."""
-    import re as _re
-    return _re.sub(r"[^a-zA-Z0-9_-]", "", task_id)
+    return _WRIKE_ID_RE.sub("", task_id)
 
 
 def wrike_post_comment(task_id: str, html_comment: str):
     """Post a comment to a Wrike task."""
-    import requests
     if not WRIKE_API_TOKEN:
         print("[Wrike] No API token configured - skipping comment post")
         return
@@ -367,20 +509,19 @@ def wrike_post_comment(task_id: str, html_comment: str):
     url = f"https://www.wrike.com/api/v4/tasks/{task_id}/comments"
     headers = {"Authorization": f"Bearer {WRIKE_API_TOKEN}"}
     data = {"text": html_comment}
-    resp = requests.post(url, headers=headers, json=data)
+    resp = _WRIKE_SESSION.post(url, headers=headers, json=data, timeout=_WRIKE_TIMEOUT)
     print(f"[Wrike] Posted comment to task {task_id}: {resp.status_code}")
     return resp
 
 
 def wrike_get_task(task_id: str) -> dict:
     """Get task details from Wrike, including custom fields."""
-    import requests
     if not WRIKE_API_TOKEN:
         return {}
     task_id = _sanitize_wrike_id(task_id)
     url = f"https://www.wrike.com/api/v4/tasks/{task_id}"
     headers = {"Authorization": f"Bearer {WRIKE_API_TOKEN}"}
-    resp = requests.get(url, headers=headers)
+    resp = _WRIKE_SESSION.get(url, headers=headers, timeout=_WRIKE_TIMEOUT)
     if resp.status_code == 200:
         data = resp.json()
         if data.get("data"):
@@ -388,16 +529,24 @@ def wrike_get_task(task_id: str) -> dict:
     return {}
 
 
+# Wrike custom field ID -> (result key, value transform); unconfigured IDs are left out
+_CF_MAP = {
+    cf_id: slot for cf_id, slot in (
+        (WRIKE_CUSTOM_FIELD_SITE_URL, ("site_url", lambda v: v or "")),
+        (WRIKE_CUSTOM_FIELD_PARTNER, ("partner", lambda v: (v or "independent").lower())),
+        (WRIKE_CUSTOM_FIELD_PHASE, ("phase", lambda v: (v or "full").lower())),
+    ) if cf_id
+}
+
+
 def extract_wrike_custom_fields(task: dict) -> dict:
     """Extract partner, phase, and site URL from Wrike custom fields."""
     result = {"site_url": "", "partner": "independent", "phase": "full"}
-    for cf in task.get("customFields", []):
-        if cf["id"] == WRIKE_CUSTOM_FIELD_SITE_URL:
-            result["site_url"] = cf.get("value", "")
-        elif cf["id"] == WRIKE_CUSTOM_FIELD_PARTNER:
-            result["partner"] = cf.get("value", "independent").lower()
-        elif cf["id"] == WRIKE_CUSTOM_FIELD_PHASE:
-            result["phase"] = cf.get("value", "full").lower()
+    for cf in task.get("customFields", ()):
+        slot = _CF_MAP.get(cf["id"])
+        if slot:
+            key, transform = slot
+            result[key] = transform(cf.get("value"))
     return result
 
 
@@ -613,38 +762,9 @@ HOME_PAGE = """<!DOCTYPE html>
         <div class="history fade-in-delay">
             <div class="history-header">
                 <div class="history-title">Recent Scans</div>
-                {% if history %}<span class="history-count">{{ history | length }} scan{{ 's' if history | length != 1 else '' }}</span>{% endif %}
-            </div>
-            <div id="historyList">
-                {% for scan in history %}
-                <div class="history-item">
-                    <div class="history-left">
-                        {% if scan.scan_id %}<span class="scan-id-badge">{{ scan.scan_id }}</span>{% endif %}
-                        <div>
-                            <div class="history-site">{{ scan.site_url }}</div>
-                            <div class="history-meta">
-                                <span>{{ scan.partner | title }}</span>
-                                <span class="meta-dot"></span>
-                                <span>{{ scan.phase | title }}</span>
-                                <span class="meta-dot"></span>
-                                <span>{{ scan.scan_time[:10] }}</span>
-                            </div>
-                        </div>
-                    </div>
-                    <div style="display:flex;align-items:center;gap:16px;">
-                        <div class="score-ring {% if scan.score >= 85 %}good{% elif scan.score >= 70 %}ok{% else %}bad{% endif %}">{{ scan.score }}</div>
-                        <a href="/reports/{{ scan.report_file }}" target="_blank" class="view-link">View &rarr;</a>
-                    </div>
-                </div>
-                {% endfor %}
-                {% if not history %}
-                <div class="empty-history">
-                    <div class="empty-icon">📋</div>
-                    <div>No scans yet</div>
-                    <div style="font-size:13px;margin-top:4px;color:#9ca3af;">Run your first scan above to see results here</div>
-                </div>
-                {% endif %}
+                <span class="history-count" id="historyCount" style="display:none;"></span>
             </div>
+            <div id="historyList"></div>
         </div>
 
         <div class="footer">
@@ -657,6 +777,52 @@ HOME_PAGE = """<!DOCTYPE html>
     </div>
 
     <script>
+        // Recent scans are fetched so the page shell itself can be served precompressed
+        function esc(s) {
+            return String(s ?? '').replace(/[&<>"']/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c]));
+        }
+        function titleCase(s) {
+            return String(s ?? '').toLowerCase().replace(/(^|[^a-z0-9])([a-z])/g, (m, p, c) => p + c.toUpperCase());
+        }
+        function renderHistory(history) {
+            const list = document.getElementById('historyList');
+            const count = document.getElementById('historyCount');
+            if (!history.length) {
+                count.style.display = 'none';
+                list.innerHTML = '<div class="empty-history">' +
+                    '<div class="empty-icon">📋</div>' +
+                    '<div>No scans yet</div>' +
+                    '<div style="font-size:13px;margin-top:4px;color:#9ca3af;">Run your first scan above to see results here</div>' +
+                    '</div>';
+                return;
+            }
+            count.textContent = history.length + ' scan' + (history.length !== 1 ? 's' : '');
+            count.style.display = '';
+            list.innerHTML = history.map(scan => {
+                const ring = scan.score >= 85 ? 'good' : scan.score >= 70 ? 'ok' : 'bad';
+                return '<div class="history-item">' +
+                    '<div class="history-left">' +
+                    (scan.scan_id ? '<span class="scan-id-badge">' + esc(scan.scan_id) + '</span>' : '') +
+                    '<div>' +
+                    '<div class="history-site">' + esc(scan.site_url) + '</div>' +
+                    '<div class="history-meta">' +
+                    '<span>' + esc(titleCase(scan.partner)) + '</span>' +
+                    '<span class="meta-dot"></span>' +
+                    '<span>' + esc(titleCase(scan.phase)) + '</span>' +
+                    '<span class="meta-dot"></span>' +
+                    '<span>' + esc(String(scan.scan_time ?? '').slice(0, 10)) + '</span>' +
+                    '</div></div></div>' +
+                    '<div style="display:flex;align-items:center;gap:16px;">' +
+                    '<div class="score-ring ' + ring + '">' + esc(scan.score) + '</div>' +
+                    '<a href="/reports/' + esc(scan.report_file) + '" target="_blank" class="view-link">View &rarr;</a>' +
+                    '</div></div>';
+            }).join('');
+        }
+        fetch('/api/history' + location.search)
+            .then(r => r.ok ? r.json() : {history: []})
+            .then(data => renderHistory(data.history || []))
+            .catch(() => renderHistory([]));
+
         document.getElementById('scanForm').addEventListener('submit', async function(e) {
             e.preventDefault();
             const btn = document.getElementById('submitBtn');
@@ -756,40 +922,161 @@ HOME_PAGE = """<!DOCTYPE html>
 </body>
 </html>"""
 
+# Templates are parsed and compiled once at import; render_template() still applies
+# Flask's context processors to a Template object. The home page has no per-request
+# data at all (recent scans come from /api/history), so it is rendered once here,
+# with a gzip copy kept for clients that accept it.
+_HOME_HTML = app.jinja_env.from_string(HOME_PAGE).render(**ASSET_CONTEXT).encode("utf-8")
+_HOME_GZ = gzip.compress(_HOME_HTML, 9)
+
+# The home page lists only the most recent scans; /history shows everything
+HOME_HISTORY_PER_PAGE = 50
+
 
 @app.route("/")
 def home():
-    _load_scan_history()
-    return render_template_string(HOME_PAGE, history=list(reversed(scan_history)), logo_uri=LOGO_DATA_URI, logo_white_uri=LOGO_WHITE_URI, bg_purple_uri=BG_PURPLE_URI)
+    # accept_encodings honours q-values, so "gzip;q=0" is a refusal (as in serve_report)
+    if "gzip" in request.accept_encodings:
+        resp = Response(_HOME_GZ, mimetype="text/html")
+        resp.headers["Content-Encoding"] = "gzip"
+    else:
+        resp = Response(_HOME_HTML, mimetype="text/html")
+    resp.vary.add("Accept-Encoding")
+    return resp
+
+
+@app.route("/api/history")
+def api_history():
+    """Recent scans for the home page, newest first. Supports ?page=N&per_page=M."""
+    page = max(1, request.args.get("page", 1, type=int))
+    per_page = min(200, max(1, request.args.get("per_page", HOME_HISTORY_PER_PAGE, type=int)))
+    return jsonify({"history": _load_recent_scan_history(per_page, (page - 1) * per_page)})
+
+
+# Saved reports never change (reviews and rescored totals live in other columns),
+# so browsers may keep them for a day and revalidate by ETag.
+_REPORT_MAX_AGE = 86400
+
+
+# (filename, report_type) -> (etag, gzip body, brotli body or None), most recently
+# used last. No identity copy is kept; the rare client without gzip support gets
+# the gzip body decompressed.
+_report_cache: OrderedDict = OrderedDict()
+_report_cache_lock = threading.Lock()
+_REPORT_CACHE_SIZE = 32
+
+
+def _cache_report(filename: str, report_type: str, content: str) -> tuple:
+    """Compress a report once and keep it for serve_report. Called when a scan is saved.
+
+    Reports are cached and served immutable by filename, which is only safe because a
+    stored report is never rewritten (db_update_scan_score only touches the score
+    column). Anything that regenerates a report in place, e.g. after human review,
+    must write it under a new filename or evict it here and drop `immutable`.
+    """
+    body = content.encode("utf-8")
+    entry = (hashlib.md5(body).hexdigest(), gzip.compress(body, 5),
+             brotli.compress(body, quality=6) if _HAS_BROTLI else None)
+    with _report_cache_lock:
+        _report_cache[(filename, report_type)] = entry
+        _report_cache.move_to_end((filename, report_type))
+        while len(_report_cache) > _REPORT_CACHE_SIZE:
+            _report_cache.popitem(last=False)
+    return entry
+
+
+def _get_cached_report(filename: str, report_type: str) -> tuple:
+    """Return (etag, gzip body, brotli body or None), fetching from the database on a miss.
+    Raises LookupError when the report is not in the database, so misses are not cached."""
+    key = (filename, report_type)
+    with _report_cache_lock:
+        entry = _report_cache.get(key)
+        if entry is not None:
+            _report_cache.move_to_end(key)
+            return entry
+    content = db_get_report(filename, report_type)
+    if content is None:
+        raise LookupError(filename)
+    return _cache_report(filename, report_type, content)
 
 
 @app.route("/reports/<path:filename>")
 def serve_report(filename):
-    # Try database first
+    # Try the in-memory cache, then the database
     try:
         if filename.endswith(".json"):
             html_name = filename.replace(".json", ".html")
-            content = db_get_report(html_name, "json")
-            if content is not None:
-                return app.response_class(content, mimetype="application/json")
+            etag, gz_body, br_body = _get_cached_report(html_name, "json")
+            mimetype = "application/json"
+        else:
+            etag, gz_body, br_body = _get_cached_report(filename, "html")
+            mimetype = "text/html"
+        # Distinct validator per encoding
+        if br_body is not None and "br" in request.accept_encodings:
+            resp = app.response_class(br_body, mimetype=mimetype)
+            resp.headers["Content-Encoding"] = "br"
+            etag += "-br"
+        elif "gzip" in request.accept_encodings:
+            resp = app.response_class(gz_body, mimetype=mimetype)
+            resp.headers["Content-Encoding"] = "gzip"
+            etag += "-gz"
         else:
-            content = db_get_report(filename, "html")
-            if content is not None:
-                return app.response_class(content, mimetype="text/html")
+            resp = app.response_class(gzip.decompress(gz_body), mimetype=mimetype)
+        resp.vary.add("Accept-Encoding")
+        resp.set_etag(etag)
+        resp.cache_control.public = True
+        resp.cache_control.max_age = _REPORT_MAX_AGE
+        resp.cache_control.immutable = True
+        return resp.make_conditional(request)
+    except LookupError:
+        pass
     except Exception as e:
         print(f"[DB] Error serving report, falling back to filesystem: {e}")
 
-    # Fallback: filesystem
-    return send_from_directory(REPORTS_DIR, filename)
+    # Fallback: filesystem (conditional=True gives ETag/Last-Modified and 304s)
+    return send_from_directory(REPORTS_DIR, filename, conditional=True, max_age=_REPORT_MAX_AGE)
 
 
 # ---------------------------------------------------------------------------
 # Persistent scan history (loads from reports/ directory)
 # ---------------------------------------------------------------------------
 
+# reports/ mtime at the last complete filesystem history load. Adding or removing a
+# report changes it, so an unchanged value means there is nothing new to parse.
+_reports_dir_mtime_ns = None
+
+
+# Threads used to parse new report JSON files when history falls back to the filesystem
+HISTORY_LOAD_WORKERS = 8
+
+
+def _parse_history_report(entry: tuple) -> dict | None:
+    """Read one (mtime, filename, path) report JSON into a history entry, or None if unusable."""
+    _, jf, path = entry
+    try:
+        with open(path, "rb") as f:
+            data = _loads_json(f.read())
+        meta = data.get("metadata", {})
+        summary = data.get("summary", {})
+        if not meta.get("site_url"):
+            return None
+        return {
+            "scan_id": meta.get("scan_id", ""),
+            "site_url": meta.get("site_url", ""),
+            "partner": meta.get("partner", ""),
+            "phase": meta.get("phase", ""),
+            "score": summary.get("score", 0),
+            "scan_time": meta.get("scan_time", ""),
+            "report_file": jf.replace(".json", ".html"),
+            "_json_file": jf,
+        }
+    except Exception:
+        return None
+
+
 def _load_scan_history():
     """Load scan history from database or filesystem."""
-    global scan_history
+    global scan_history, _reports_dir_mtime_ns
 
     # Try database first
     try:
@@ -801,34 +1088,98 @@ def _load_scan_history():
         print(f"[DB] Error loading scan history, falling back to filesystem: {e}")
 
     # Fallback: filesystem
-    known_files = {s.get("_json_file") for s in scan_history if s.get("_json_file")}
-    json_files = sorted(
-        [f for f in os.listdir(REPORTS_DIR) if f.endswith(".json") and f != "scan_counter.json"],
-        key=lambda x: os.path.getmtime(os.path.join(REPORTS_DIR, x)),
-    )
-    for jf in json_files:
-        if jf in known_files:
-            continue
-        try:
-            with open(os.path.join(REPORTS_DIR, jf), "r") as f:
-                data = json.load(f)
-            meta = data.get("metadata", {})
-            summary = data.get("summary", {})
-            if not meta.get("site_url"):
-                continue
-            html_file = jf.replace(".json", ".html")
-            scan_history.append({
-                "scan_id": meta.get("scan_id", ""),
-                "site_url": meta.get("site_url", ""),
-                "partner": meta.get("partner", ""),
-                "phase": meta.get("phase", ""),
-                "score": summary.get("score", 0),
-                "scan_time": meta.get("scan_time", ""),
-                "report_file": html_file,
-                "_json_file": jf,
-            })
-        except Exception:
-            continue
+    with _history_lock:
+        dir_mtime_ns = os.stat(REPORTS_DIR).st_mtime_ns
+        if dir_mtime_ns == _reports_dir_mtime_ns:
+            return
+
+        # DB-loaded entries have no _json_file; their report name gives the same file
+        known_files = {s.get("_json_file") or s["report_file"].replace(".html", ".json")
+                       for s in scan_history if s.get("_json_file") or s.get("report_file")}
+        # One scandir pass; only reports not already in history are stat'ed for the sort
+        with os.scandir(REPORTS_DIR) as it:
+            new_entries = sorted(
+                (e.stat().st_mtime, e.name, e.path) for e in it
+                if e.name.endswith(".json") and e.name != "scan_counter.json"
+                and e.name not in known_files and e.is_file()
+            )
+        # Reads are I/O-bound, so a few threads hide per-file latency on slow disks;
+        # map() keeps results in mtime order
+        if len(new_entries) > 1:
+            with ThreadPoolExecutor(max_workers=min(HISTORY_LOAD_WORKERS, len(new_entries))) as pool:
+                parsed = list(pool.map(_parse_history_report, new_entries))
+        else:
+            parsed = [_parse_history_report(e) for e in new_entries]
+        # Rebind rather than extend: after a DB outage scan_history may still be the
+        # list cached by db_load_scan_history, which must not be edited
+        scan_history = scan_history + [entry for entry in parsed if entry]
+
+        # Directory mtimes are only as fine as the filesystem clock tick, so a report
+        # written in the same tick as this load could hide behind an unchanged value.
+        # Only trust the gate once the mtime is safely in the past.
+        if time.time_ns() - dir_mtime_ns > 2_000_000_000:
+            _reports_dir_mtime_ns = dir_mtime_ns
+
+
+def _load_recent_scan_history(limit: int, offset: int = 0) -> list:
+    """Return one page of scan history, newest first, without loading every scan from the DB."""
+    try:
+        db_history = db_load_scan_history(limit=limit, offset=offset)
+        if db_history is not None:
+            return db_history[::-1]
+    except Exception as e:
+        print(f"[DB] Error loading scan history, falling back to filesystem: {e}")
+
+    _load_scan_history()
+    end = len(scan_history) - offset
+    return scan_history[max(0, end - limit):max(0, end)][::-1]
+
+
+# ---------------------------------------------------------------------------
+# Shared page styles (rules, history and rules editor pages)
+# ---------------------------------------------------------------------------
+
+# Base, header and nav styles common to the branded pages. Served once as a
+# cacheable stylesheet instead of being inlined (with the header's base64
+# background image) in every response.
+COMMON_CSS = """* { margin: 0; padding: 0; box-sizing: border-box; }
+body { font-family: 'Segoe UI', -apple-system, BlinkMacSystemFont, Roboto, Arial, sans-serif;
+       background: #f9fafb; color: #111827; -webkit-font-smoothing: antialiased; overflow-y: scroll; }
+.header {
+    {% if bg_purple_uri %}background: url('{{ bg_purple_uri }}') center/cover no-repeat;{% else %}background: linear-gradient(135deg, #1e1b4b 0%, #312e81 30%, #4f46e5 70%, #6366f1 100%);{% endif %}
+    color: white; padding: 32px 40px; position: relative; overflow: hidden;
+    box-shadow: 0 4px 20px rgba(79,70,229,0.25);
+}
+.header::before { content: ''; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
+    background: radial-gradient(ellipse at 30% 0%, rgba(255,255,255,0.1) 0%, transparent 50%); }
+.header::after { content: ''; position: absolute; top: -80%; right: -20%; width: 500px; height: 500px;
+    background: radial-gradient(circle, rgba(255,255,255,0.08) 0%, transparent 60%); border-radius: 50%; }
+.header-inner { display: flex; justify-content: space-between; align-items: center; position: relative; z-index: 1; max-width: 1200px; margin: 0 auto; width: 100%; }
+.header-left { display: flex; align-items: center; gap: 18px; }
+.header-logo { height: 34px; filter: drop-shadow(0 2px 4px rgba(0,0,0,0.1)); }
+.header h1 { font-size: 22px; font-weight: 700; letter-spacing: -0.5px; text-shadow: 0 1px 2px rgba(0,0,0,0.1); }
+.header p { font-size: 13px; opacity: 0.8; margin-top: 3px; font-weight: 500; }
+.nav-links { display: flex; gap: 8px; }
+.nav-links a { color: rgba(255,255,255,0.85); font-size: 13px; font-weight: 600;
+    text-decoration: none; padding: 8px 16px; border-radius: 8px; transition: all 0.2s;
+    border: 1px solid transparent; }
+.nav-links a:hover { background: rgba(255,255,255,0.15); color: #fff; border-color: rgba(255,255,255,0.2); }
+"""
+
+_COMMON_CSS = app.jinja_env.from_string(COMMON_CSS).render(**ASSET_CONTEXT).encode("utf-8")
+_COMMON_CSS_ETAG = hashlib.md5(_COMMON_CSS).hexdigest()
+# Versioned URL, so the stylesheet can be cached for a year and still change on deploy
+app.jinja_env.globals["common_css_url"] = f"/static/qa-common.css?v={_COMMON_CSS_ETAG[:12]}"
+
+
+@app.route("/static/qa-common.css")
+def common_css():
+    resp = app.response_class(_COMMON_CSS, mimetype="text/css")
+    resp.set_etag(_COMMON_CSS_ETAG)
+    resp.cache_control.public = True
+    resp.cache_control.max_age = 31536000
+    resp.cache_control.immutable = True
+    return resp.make_conditional(request)
 
 
 # ---------------------------------------------------------------------------
@@ -841,29 +1192,8 @@ RULES_PAGE = """<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>QA Rules - Zero-Touch QA</title>
+    <link rel="stylesheet" href="{{ common_css_url }}">
     <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: 'Segoe UI', -apple-system, BlinkMacSystemFont, Roboto, Arial, sans-serif;
-               background: #f9fafb; color: #111827; -webkit-font-smoothing: antialiased; overflow-y: scroll; }
-        .header {
-            {% if bg_purple_uri %}background: url('{{ bg_purple_uri }}') center/cover no-repeat;{% else %}background: linear-gradient(135deg, #1e1b4b 0%, #312e81 30%, #4f46e5 70%, #6366f1 100%);{% endif %}
-            color: white; padding: 32px 40px; position: relative; overflow: hidden;
-            box-shadow: 0 4px 20px rgba(79,70,229,0.25);
-        }
-        .header::before { content: ''; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
-            background: radial-gradient(ellipse at 30% 0%, rgba(255,255,255,0.1) 0%, transparent 50%); }
-        .header::after { content: ''; position: absolute; top: -80%; right: -20%; width: 500px; height: 500px;
-            background: radial-gradient(circle, rgba(255,255,255,0.08) 0%, transparent 60%); border-radius: 50%; }
-        .header-inner { display: flex; justify-content: space-between; align-items: center; position: relative; z-index: 1; max-width: 1200px; margin: 0 auto; width: 100%; }
-        .header-left { display: flex; align-items: center; gap: 18px; }
-        .header-logo { height: 34px; filter: drop-shadow(0 2px 4px rgba(0,0,0,0.1)); }
-        .header h1 { font-size: 22px; font-weight: 700; letter-spacing: -0.5px; text-shadow: 0 1px 2px rgba(0,0,0,0.1); }
-        .header p { font-size: 13px; opacity: 0.8; margin-top: 3px; font-weight: 500; }
-        .nav-links { display: flex; gap: 8px; }
-        .nav-links a { color: rgba(255,255,255,0.85); font-size: 13px; font-weight: 600;
-            text-decoration: none; padding: 8px 16px; border-radius: 8px; transition: all 0.2s;
-            border: 1px solid transparent; }
-        .nav-links a:hover { background: rgba(255,255,255,0.15); color: #fff; border-color: rgba(255,255,255,0.2); }
         .container { max-width: 1000px; margin: 28px auto; padding: 0 24px; }
         .intro { background: #eef2ff; border-radius: 12px; padding: 18px 24px; margin-bottom: 24px;
                  font-size: 14px; color: #3730a3; line-height: 1.6; }
@@ -978,6 +1308,8 @@ RULES_PAGE = """<!DOCTYPE html>
 </body>
 </html>"""
 
+_RULES_TEMPLATE = app.jinja_env.from_string(RULES_PAGE)
+
 
 HISTORY_PAGE = """<!DOCTYPE html>
 <html lang="en">
@@ -985,29 +1317,8 @@ HISTORY_PAGE = """<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Scan History - Zero-Touch QA</title>
+    <link rel="stylesheet" href="{{ common_css_url }}">
     <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: 'Segoe UI', -apple-system, BlinkMacSystemFont, Roboto, Arial, sans-serif;
-               background: #f9fafb; color: #111827; -webkit-font-smoothing: antialiased; overflow-y: scroll; }
-        .header {
-            {% if bg_purple_uri %}background: url('{{ bg_purple_uri }}') center/cover no-repeat;{% else %}background: linear-gradient(135deg, #1e1b4b 0%, #312e81 30%, #4f46e5 70%, #6366f1 100%);{% endif %}
-            color: white; padding: 32px 40px; position: relative; overflow: hidden;
-            box-shadow: 0 4px 20px rgba(79,70,229,0.25);
-        }
-        .header::before { content: ''; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
-            background: radial-gradient(ellipse at 30% 0%, rgba(255,255,255,0.1) 0%, transparent 50%); }
-        .header::after { content: ''; position: absolute; top: -80%; right: -20%; width: 500px; height: 500px;
-            background: radial-gradient(circle, rgba(255,255,255,0.08) 0%, transparent 60%); border-radius: 50%; }
-        .header-inner { display: flex; justify-content: space-between; align-items: center; position: relative; z-index: 1; max-width: 1200px; margin: 0 auto; width: 100%; }
-        .header-left { display: flex; align-items: center; gap: 18px; }
-        .header-logo { height: 34px; filter: drop-shadow(0 2px 4px rgba(0,0,0,0.1)); }
-        .header h1 { font-size: 22px; font-weight: 700; letter-spacing: -0.5px; text-shadow: 0 1px 2px rgba(0,0,0,0.1); }
-        .header p { font-size: 13px; opacity: 0.8; margin-top: 3px; font-weight: 500; }
-        .nav-links { display: flex; gap: 8px; }
-        .nav-links a { color: rgba(255,255,255,0.85); font-size: 13px; font-weight: 600;
-            text-decoration: none; padding: 8px 16px; border-radius: 8px; transition: all 0.2s;
-            border: 1px solid transparent; }
-        .nav-links a:hover { background: rgba(255,255,255,0.15); color: #fff; border-color: rgba(255,255,255,0.2); }
         .container { max-width: 1100px; margin: 28px auto; padding: 0 24px; }
         .intro { background: #eef2ff; border-radius: 12px; padding: 18px 24px; margin-bottom: 24px;
                  font-size: 14px; color: #3730a3; line-height: 1.6; }
@@ -1052,6 +1363,8 @@ HISTORY_PAGE = """<!DOCTYPE html>
              font-weight: 700; text-transform: uppercase; letter-spacing: 0.3px;
              cursor: pointer; user-select: none; white-space: nowrap; }
         th:hover { background: #4338ca; }
+        th a { color: #fff; text-decoration: none; font-weight: 700; display: block; }
+        th a:hover { text-decoration: none; }
         th .sort-arrow { font-size: 10px; margin-left: 4px; opacity: 0.5; }
         th.sorted .sort-arrow { opacity: 1; }
         td { padding: 14px 16px; border-bottom: 1px solid #f3f4f6; font-size: 14px; }
@@ -1072,6 +1385,8 @@ HISTORY_PAGE = """<!DOCTYPE html>
                   border: 1.5px solid #e5e7eb; background: #fff; color: #374151; cursor: pointer;
                   text-decoration: none; display: inline-flex; align-items: center; gap: 4px; }
         .btn-sm:hover { background: #f9fafb; border-color: #d1d5db; text-decoration: none; }
+        .pager { display: flex; justify-content: center; align-items: center; gap: 16px;
+                 margin-top: 16px; font-size: 13px; color: #6b7280; }
         .empty { text-align: center; padding: 40px; color: #9ca3af; font-size: 14px; }
         .footer { text-align: center; padding: 24px 0; font-size: 12px; color: #d1d5db; }
         @media (max-width: 768px) {
@@ -1101,188 +1416,150 @@ HISTORY_PAGE = """<!DOCTYPE html>
         </div>
     </div>
     <div class="container">
-        {% if history %}
+        {% if stats.total %}
         <!-- Stats -->
         <div class="stats-row">
             <div class="stat-card">
-                <div class="stat-value stat-total">{{ history|length }}</div>
+                <div class="stat-value stat-total">{{ stats.total }}</div>
                 <div class="stat-label">Total Scans</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value stat-passing">{{ history|selectattr('score', 'ge', 85)|list|length }}</div>
+                <div class="stat-value stat-passing">{{ stats.passing }}</div>
                 <div class="stat-label">Passing (85+)</div>
             </div>
             <div class="stat-card">
-                <div class="stat-value stat-needs-work">{{ history|selectattr('score', 'lt', 85)|list|length }}</div>
+                <div class="stat-value stat-needs-work">{{ stats.needs_work }}</div>
                 <div class="stat-label">Needs Work (&lt;85)</div>
             </div>
         </div>
 
-        <!-- Filters -->
-        <div class="filter-bar">
+        <!-- Filters (applied server-side) -->
+        <form class="filter-bar" id="filterForm" method="get" action="/history">
+            {% if filters.sort %}<input type="hidden" name="sort" value="{{ filters.sort }}"><input type="hidden" name="dir" value="{{ filters.dir }}">{% endif %}
+            {% if filters.per_page %}<input type="hidden" name="per_page" value="{{ filters.per_page }}">{% endif %}
             <label>Search:</label>
-            <input type="text" id="searchInput" placeholder="Filter by site URL or scan ID..." oninput="filterTable()">
+            <input type="text" id="searchInput" name="q" value="{{ filters.q }}" placeholder="Filter by site URL or scan ID..." oninput="submitSoon()">
             <label>Partner:</label>
-            <select id="partnerFilter" onchange="filterTable()">
+            <select name="partner" onchange="this.form.submit()">
                 <option value="all">All</option>
-                {% for p in partners %}<option value="{{ p }}">{{ p | title }}</option>{% endfor %}
+                {% for p, label in partners %}<option value="{{ p }}"{% if p == filters.partner %} selected{% endif %}>{{ label }}</option>{% endfor %}
             </select>
             <label>Phase:</label>
-            <select id="phaseFilter" onchange="filterTable()">
+            <select name="phase" onchange="this.form.submit()">
                 <option value="all">All</option>
-                <option value="prototype">Prototype</option>
-                <option value="full">Full Build</option>
-                <option value="final">Final</option>
+                {% for value, label in phase_options %}<option value="{{ value }}"{% if value == filters.phase %} selected{% endif %}>{{ label }}</option>{% endfor %}
             </select>
             <label>Score:</label>
-            <select id="scoreFilter" onchange="filterTable()">
+            <select name="score" onchange="this.form.submit()">
                 <option value="all">All</option>
-                <option value="pass">85+ (Passing)</option>
-                <option value="warn">70-84 (Needs Work)</option>
-                <option value="fail">&lt;70 (Major Issues)</option>
+                {% for value, label in score_options %}<option value="{{ value }}"{% if value == filters.score %} selected{% endif %}>{{ label }}</option>{% endfor %}
             </select>
-            <span class="filter-count" id="filterCount">{{ history|length }} scan(s)</span>
-        </div>
+            <span class="filter-count" id="filterCount">{{ filtered_total }} scan(s)</span>
+        </form>
 
         <div class="intro" style="padding: 12px 20px;">
             <strong>Tip:</strong> Click any column header to sort. Click "View" to open a report in the browser.
             To save a report as PDF, open it and use your browser's Print function (Ctrl+P / Cmd+P).
         </div>
 
+        {% if rows_html %}
         <table id="historyTable">
             <thead>
                 <tr>
-                    <th onclick="sortTable(0)" data-col="0">Scan ID <span class="sort-arrow">&#9650;</span></th>
-                    <th onclick="sortTable(1)" data-col="1">Site URL <span class="sort-arrow">&#9650;</span></th>
-                    <th onclick="sortTable(2)" data-col="2">Partner <span class="sort-arrow">&#9650;</span></th>
-                    <th onclick="sortTable(3)" data-col="3">Phase <span class="sort-arrow">&#9650;</span></th>
-                    <th onclick="sortTable(4)" data-col="4" class="sorted">Score <span class="sort-arrow">&#9660;</span></th>
-                    <th onclick="sortTable(5)" data-col="5">Date <span class="sort-arrow">&#9650;</span></th>
+                    {% for col, label in sort_columns %}
+                    <th{% if col == filters.sort %} class="sorted"{% endif %}><a href="{{ sort_urls[col] }}">{{ label }} <span class="sort-arrow">{% if col == filters.sort and filters.dir == 'desc' %}&#9660;{% else %}&#9650;{% endif %}</span></a></th>
+                    {% endfor %}
                     <th>Report</th>
                 </tr>
             </thead>
             <tbody>
-                {% for scan in history %}
-                <tr data-site="{{ scan.site_url|lower }}" data-partner="{{ scan.partner }}" data-phase="{{ scan.phase }}" data-score="{{ scan.score }}" data-id="{{ (scan.scan_id or '')|lower }}">
-                    <td style="font-weight: 700; color: #4f46e5; font-family: monospace;">{{ scan.scan_id or '—' }}</td>
-                    <td style="max-width: 280px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;" title="{{ scan.site_url }}">{{ scan.site_url }}</td>
-                    <td>{{ scan.partner | title }}</td>
-                    <td>{{ scan.phase | title }}</td>
-                    <td>
-                        <span class="{% if scan.score >= 85 %}score-good{% elif scan.score >= 70 %}score-ok{% else %}score-bad{% endif %}">{{ scan.score }}/100</span>
-                        <span class="score-bar"><span class="score-bar-fill" style="width:{{ scan.score }}%;background:{% if scan.score >= 85 %}#16a34a{% elif scan.score >= 70 %}#d97706{% else %}#dc2626{% endif %};"></span></span>
-                    </td>
-                    <td style="white-space: nowrap;">{{ scan.scan_time[:10] }}</td>
-                    <td>
-                        <div class="report-links">
-                            <a href="/reports/{{ scan.report_file }}" target="_blank">View</a>
-                            <a href="/reports/{{ scan.report_file.replace('.html', '.json') }}" target="_blank" class="btn-sm" title="Download JSON audit trail">JSON</a>
-                        </div>
-                    </td>
-                </tr>
-                {% endfor %}
+{{ rows_html }}
             </tbody>
         </table>
+        {% if pages > 1 %}
+        <div class="pager">
+            {% if prev_url %}<a href="{{ prev_url }}">&larr; Newer</a>{% endif %}
+            <span>Page {{ page }} of {{ pages }}</span>
+            {% if next_url %}<a href="{{ next_url }}">Older &rarr;</a>{% endif %}
+        </div>
+        {% endif %}
+        {% else %}
+        <div class="empty">No scans match these filters. <a href="/history">Clear filters</a></div>
+        {% endif %}
         {% else %}
         <div class="empty">No scans recorded yet. Run a scan from the <a href="/">Scanner</a> page to see results here.</div>
         {% endif %}
 
-        <div class="footer">Zero-Touch QA Scanner &bull; {{ history|length }} scan(s) recorded</div>
+        <div class="footer">Zero-Touch QA Scanner &bull; {{ stats.total }} scan(s) recorded</div>
     </div>
 
     <script>
-    function filterTable() {
-        var search = document.getElementById('searchInput').value.toLowerCase();
-        var partner = document.getElementById('partnerFilter').value;
-        var phase = document.getElementById('phaseFilter').value;
-        var scoreFilter = document.getElementById('scoreFilter').value;
-        var rows = document.querySelectorAll('#historyTable tbody tr');
-        var visible = 0;
-        rows.forEach(function(row) {
-            var site = row.dataset.site || '';
-            var id = row.dataset.id || '';
-            var rPartner = row.dataset.partner || '';
-            var rPhase = row.dataset.phase || '';
-            var score = parseInt(row.dataset.score || '0');
-            var show = true;
-            if (search && site.indexOf(search) === -1 && id.indexOf(search) === -1) show = false;
-            if (partner !== 'all' && rPartner !== partner) show = false;
-            if (phase !== 'all' && rPhase !== phase) show = false;
-            if (scoreFilter === 'pass' && score < 85) show = false;
-            if (scoreFilter === 'warn' && (score < 70 || score >= 85)) show = false;
-            if (scoreFilter === 'fail' && score >= 70) show = false;
-            row.style.display = show ? '' : 'none';
-            if (show) visible++;
-        });
-        document.getElementById('filterCount').textContent = visible + ' scan(s)';
+    // Filtering, sorting and paging happen on the server; the search box
+    // resubmits the form once typing pauses
+    var searchTimer;
+    function submitSoon() {
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(function() { document.getElementById('filterForm').submit(); }, 400);
     }
-
-    var sortDir = {};
-    function sortTable(colIdx) {
-        var table = document.getElementById('historyTable');
-        var tbody = table.querySelector('tbody');
-        var rows = Array.from(tbody.querySelectorAll('tr'));
-        var dir = sortDir[colIdx] === 'asc' ? 'desc' : 'asc';
-        sortDir[colIdx] = dir;
-        rows.sort(function(a, b) {
-            var aText = a.cells[colIdx].textContent.trim();
-            var bText = b.cells[colIdx].textContent.trim();
-            if (colIdx === 4) { // Score column - numeric sort
-                aText = parseInt(aText) || 0;
-                bText = parseInt(bText) || 0;
-            }
-            if (typeof aText === 'number') {
-                return dir === 'asc' ? aText - bText : bText - aText;
-            }
-            return dir === 'asc' ? aText.localeCompare(bText) : bText.localeCompare(aText);
-        });
-        rows.forEach(function(row) { tbody.appendChild(row); });
-        // Update sort arrows
-        table.querySelectorAll('th').forEach(function(th) {
-            th.classList.remove('sorted');
-            th.querySelector('.sort-arrow').innerHTML = '&#9650;';
-        });
-        var th = table.querySelector('th[data-col="' + colIdx + '"]');
-        th.classList.add('sorted');
-        th.querySelector('.sort-arrow').innerHTML = dir === 'asc' ? '&#9650;' : '&#9660;';
+    var searchInput = document.getElementById('searchInput');
+    if (searchInput && searchInput.value) {
+        searchInput.focus();
+        searchInput.setSelectionRange(searchInput.value.length, searchInput.value.length);
     }
     </script>
 </body>
 </html>"""
 
 
+_HISTORY_TEMPLATE = app.jinja_env.from_string(HISTORY_PAGE)
+
+
+_CATEGORY_LABELS = {
+    "search_replace": "Better Search Replace",
+    "functionality": "Functionality",
+    "craftsmanship": "Craftsmanship",
+    "content": "Content",
+    "grammar_spelling": "Grammar & Spelling",
+    "footer": "Footer",
+    "navigation": "Navigation",
+    "cta": "Call-to-Action",
+    "forms": "Forms",
+    "human_review": "Requires Human Review",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _category_label(category: str) -> str:
+    """Heading for a rule category; unknown categories are title-cased once."""
+    return _CATEGORY_LABELS.get(category, category.replace("_", " ").title())
+
+
 @app.route("/rules")
 def rules_page():
     """Show all QA rules in a browsable, filterable page."""
-    data = get_all_rules()
-    all_rules = []
-    for group_name, group_rules in data.items():
-        for rule in group_rules:
-            rule["_group"] = group_name
-            all_rules.append(rule)
-
-    cat_labels = {
-        "search_replace": "Better Search Replace",
-        "functionality": "Functionality",
-        "craftsmanship": "Craftsmanship",
-        "content": "Content",
-        "grammar_spelling": "Grammar & Spelling",
-        "footer": "Footer",
-        "navigation": "Navigation",
-        "cta": "Call-to-Action",
-        "forms": "Forms",
-        "human_review": "Requires Human Review",
-    }
+    return _render_rules_page(_rules_mtime())
+
+
+@functools.lru_cache(maxsize=4)
+def _render_rules_page(rules_mtime_ns: int) -> str:
+    """Render /rules once per version of rules.json; cleared when the editor saves."""
+    # One pass over every group's rules; the rule dicts are only read, never tagged
     categories = {}
-    for rule in all_rules:
-        cat = cat_labels.get(rule.get("category", ""), rule.get("category", "other").replace("_", " ").title())
-        if cat not in categories:
-            categories[cat] = []
-        if not any(r["id"] == rule["id"] for r in categories[cat]):
-            categories[cat].append(rule)
+    seen_ids = defaultdict(set)  # rule IDs already listed per category
+    total_rules = 0
+    for group_rules in get_all_rules().values():
+        total_rules += len(group_rules)
+        for rule in group_rules:
+            cat = _category_label(rule.get("category", "other"))
+            cat_rules = categories.setdefault(cat, [])
+            rule_id = rule["id"]
+            if rule_id in seen_ids[cat]:
+                continue
+            seen_ids[cat].add(rule_id)
+            cat_rules.append(rule)
 
-    return render_template_string(RULES_PAGE, categories=categories,
-                                  total_rules=len(all_rules), logo_uri=LOGO_DATA_URI, logo_white_uri=LOGO_WHITE_URI, bg_purple_uri=BG_PURPLE_URI)
+    return render_template(_RULES_TEMPLATE, categories=categories,
+                           total_rules=total_rules, **ASSET_CONTEXT)
 
 
 # ---------------------------------------------------------------------------
@@ -1295,29 +1572,8 @@ RULES_EDIT_PAGE = """<!DOCTYPE html>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Edit QA Rules - Zero-Touch QA</title>
+    <link rel="stylesheet" href="{{ common_css_url }}">
     <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { font-family: 'Segoe UI', -apple-system, BlinkMacSystemFont, Roboto, Arial, sans-serif;
-               background: #f9fafb; color: #111827; -webkit-font-smoothing: antialiased; overflow-y: scroll; }
-        .header {
-            {% if bg_purple_uri %}background: url('{{ bg_purple_uri }}') center/cover no-repeat;{% else %}background: linear-gradient(135deg, #1e1b4b 0%, #312e81 30%, #4f46e5 70%, #6366f1 100%);{% endif %}
-            color: white; padding: 32px 40px; position: relative; overflow: hidden;
-            box-shadow: 0 4px 20px rgba(79,70,229,0.25);
-        }
-        .header::before { content: ''; position: absolute; top: 0; left: 0; right: 0; bottom: 0;
-            background: radial-gradient(ellipse at 30% 0%, rgba(255,255,255,0.1) 0%, transparent 50%); }
-        .header::after { content: ''; position: absolute; top: -80%; right: -20%; width: 500px; height: 500px;
-            background: radial-gradient(circle, rgba(255,255,255,0.08) 0%, transparent 60%); border-radius: 50%; }
-        .header-inner { display: flex; justify-content: space-between; align-items: center; position: relative; z-index: 1; max-width: 1200px; margin: 0 auto; width: 100%; }
-        .header-left { display: flex; align-items: center; gap: 18px; }
-        .header-logo { height: 34px; filter: drop-shadow(0 2px 4px rgba(0,0,0,0.1)); }
-        .header h1 { font-size: 22px; font-weight: 700; letter-spacing: -0.5px; text-shadow: 0 1px 2px rgba(0,0,0,0.1); }
-        .header p { font-size: 13px; opacity: 0.8; margin-top: 3px; font-weight: 500; }
-        .nav-links { display: flex; gap: 8px; }
-        .nav-links a { color: rgba(255,255,255,0.85); font-size: 13px; font-weight: 600;
-            text-decoration: none; padding: 8px 16px; border-radius: 8px; transition: all 0.2s;
-            border: 1px solid transparent; }
-        .nav-links a:hover { background: rgba(255,255,255,0.15); color: #fff; border-color: rgba(255,255,255,0.2); }
         .container { max-width: 900px; margin: 28px auto; padding: 0 24px; }
         .intro { background: #eef2ff; border-radius: 12px; padding: 18px 24px; margin-bottom: 24px;
                  font-size: 14px; color: #3730a3; line-height: 1.6; }
@@ -1541,6 +1797,8 @@ RULES_EDIT_PAGE = """<!DOCTYPE html>
 </body>
 </html>"""
 
+_RULES_EDIT_TEMPLATE = app.jinja_env.from_string(RULES_EDIT_PAGE)
+
 
 @app.route("/rules/edit", methods=["GET", "POST"])
 def rules_edit():
@@ -1575,6 +1833,7 @@ def rules_edit():
                     data[group] = []
                 data[group].append(new_rule)
                 _save_rules(data)
+                _render_rules_page.cache_clear()
                 success = f'Rule "{new_rule["id"]}" added to {group} rules.'
 
         elif action == "delete":
@@ -1583,21 +1842,194 @@ def rules_edit():
             if group in data:
                 data[group] = [r for r in data[group] if r.get("id") != rule_id]
                 _save_rules(data)
+                _render_rules_page.cache_clear()
                 success = f'Rule "{rule_id}" deleted from {group} rules.'
 
     rules_data = get_all_rules()
-    return render_template_string(RULES_EDIT_PAGE, rules_data=rules_data,
-                                  success=success, logo_uri=LOGO_DATA_URI, logo_white_uri=LOGO_WHITE_URI, bg_purple_uri=BG_PURPLE_URI)
+    return render_template(_RULES_EDIT_TEMPLATE, rules_data=rules_data,
+                           success=success, **ASSET_CONTEXT)
+
+
+HISTORY_PER_PAGE = 50
+
+# Column key -> (header label, sort key) for the history table
+_HISTORY_COLUMNS = {
+    "id": ("Scan ID", lambda s: s.get("scan_id") or ""),
+    "site": ("Site URL", lambda s: s["site_url"].lower()),
+    "partner": ("Partner", lambda s: s.get("partner", "")),
+    "phase": ("Phase", lambda s: s.get("phase", "")),
+    "score": ("Score", lambda s: s["score"]),
+    "date": ("Date", lambda s: s["scan_time"]),
+}
+_HISTORY_SCORE_FILTERS = {
+    "pass": lambda score: score >= 85,
+    "warn": lambda score: 70 <= score < 85,
+    "fail": lambda score: score < 70,
+}
+_HISTORY_PHASE_OPTIONS = (("prototype", "Prototype"), ("full", "Full Build"), ("final", "Final"))
+_HISTORY_SCORE_OPTIONS = (("pass", "85+ (Passing)"), ("warn", "70-84 (Needs Work)"), ("fail", "<70 (Major Issues)"))
+
+
+@functools.lru_cache(maxsize=64)
+def _history_label(value: str) -> str:
+    """Display label for a partner/phase slug; there are only a handful, so title-case each once."""
+    return value.title()
+
+
+# One history table row. Filled with str.format rather than a Jinja loop so a page of
+# rows skips Jinja's per-iteration context and filter calls; every value is escaped.
+_HISTORY_ROW = """                <tr>
+                    <td style="font-weight: 700; color: #4f46e5; font-family: monospace;">{scan_id}</td>
+                    <td style="max-width: 280px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap;" title="{site_url}">{site_url}</td>
+                    <td>{partner_label}</td>
+                    <td>{phase_label}</td>
+                    <td>
+                        <span class="{score_class}">{score}/100</span>
+                        <span class="score-bar"><span class="score-bar-fill" style="width:{score}%;background:{bar_color};"></span></span>
+                    </td>
+                    <td style="white-space: nowrap;">{date}</td>
+                    <td>
+                        <div class="report-links">
+                            <a href="/reports/{report_file}" target="_blank">View</a>
+                            <a href="/reports/{json_file}" target="_blank" class="btn-sm" title="Download JSON audit trail">JSON</a>
+                        </div>
+                    </td>
+                </tr>
+"""
+
+
+def _history_row_html(scan: dict) -> str:
+    """Render one history entry as a table row."""
+    score = scan["score"]
+    if score >= 85:
+        score_class, bar_color = "score-good", "#16a34a"
+    elif score >= 70:
+        score_class, bar_color = "score-ok", "#d97706"
+    else:
+        score_class, bar_color = "score-bad", "#dc2626"
+    report_file = scan["report_file"]
+    return _HISTORY_ROW.format(
+        scan_id=escape(scan.get("scan_id") or "—"),
+        site_url=escape(scan["site_url"]),
+        partner_label=escape(_history_label(scan.get("partner", ""))),
+        phase_label=escape(_history_label(scan.get("phase", ""))),
+        score_class=score_class,
+        score=escape(score),
+        bar_color=bar_color,
+        date=escape(scan["scan_time"][:10]),
+        report_file=escape(report_file),
+        json_file=escape(report_file.replace(".html", ".json")),
+    )
+
+
+class _HistoryIndex:
+    """Per-snapshot view of scan_history: summary stats plus each column's sort order.
+
+    Built once per history change instead of on every /history request. The
+    snapshot holds the list and its last entry so in-place edits (append,
+    dedupe, trim) and wholesale replacement from the DB are both detected.
+    """
+
+    def __init__(self, history: list):
+        self.history = history
+        self.length = len(history)
+        self.last = history[-1] if history else None
+        self.newest_first = history[::-1]
+        self.passing = sum(1 for s in history if s["score"] >= 85)
+        # Lowercased "site_url\0scan_id" per entry for the search box, built once per snapshot
+        self.search_text = {id(s): f"{s['site_url']}\0{s.get('scan_id') or ''}".lower() for s in history}
+        self.partners = [(p, _history_label(p))
+                         for p in sorted({s["partner"] for s in history if s.get("partner")})]
+        self._orders = {}
+
+    def is_current(self, history: list) -> bool:
+        return (self.history is history and self.length == len(history)
+                and self.last is (history[-1] if history else None))
+
+    def order(self, sort: str, direction: str) -> list:
+        """Entries sorted by a _HISTORY_COLUMNS key, newest first among ties."""
+        key = (sort, direction)
+        if key not in self._orders:
+            self._orders[key] = sorted(self.newest_first, key=_HISTORY_COLUMNS[sort][1],
+                                       reverse=direction == "desc")
+        return self._orders[key]
+
+
+_history_index = None
+
+
+def _get_history_index() -> _HistoryIndex:
+    global _history_index
+    with _history_lock:
+        index = _history_index
+        if index is None or not index.is_current(scan_history):
+            index = _history_index = _HistoryIndex(scan_history)
+        return index
 
 
 @app.route("/history")
 def history_page():
-    """Show scan history with search, filters, and sorting."""
+    """Show scan history with search, filters, sorting and pagination (all server-side).
+
+    Query params: q, partner, phase, score (pass/warn/fail), sort (a _HISTORY_COLUMNS
+    key), dir (asc/desc), page, per_page.
+    """
     _load_scan_history()
-    history = list(reversed(scan_history))
-    partners = sorted(set(s.get("partner", "") for s in scan_history if s.get("partner")))
-    return render_template_string(HISTORY_PAGE, history=history, partners=partners,
-                                  logo_uri=LOGO_DATA_URI, logo_white_uri=LOGO_WHITE_URI, bg_purple_uri=BG_PURPLE_URI)
+    args = request.args
+    q = args.get("q", "").strip()
+    needle = q.lower()
+    partner = args.get("partner", "all")
+    phase = args.get("phase", "all")
+    score = args.get("score", "all")
+    score_ok = _HISTORY_SCORE_FILTERS.get(score)
+    sort = args.get("sort", "")
+    if sort not in _HISTORY_COLUMNS:
+        sort = ""
+    direction = "desc" if args.get("dir") == "desc" else "asc"
+    per_page = min(200, max(1, args.get("per_page", HISTORY_PER_PAGE, type=int)))
+
+    # Stats, partner options and sort orders are cached per history snapshot;
+    # filtering walks an already-sorted order, so no per-request sort
+    index = _get_history_index()
+    ordered = index.order(sort, direction) if sort else index.newest_first
+    search_text = index.search_text
+    if needle or partner != "all" or phase != "all" or score_ok:
+        matches = [
+            scan for scan in ordered
+            if (not needle or needle in search_text[id(scan)])
+            and (partner == "all" or scan.get("partner") == partner)
+            and (phase == "all" or scan.get("phase") == phase)
+            and (not score_ok or score_ok(scan["score"]))
+        ]
+    else:
+        matches = ordered
+
+    pages = max(1, -(-len(matches) // per_page))
+    page = min(pages, max(1, args.get("page", 1, type=int)))
+    rows_html = Markup("".join(_history_row_html(scan) for scan in matches[(page - 1) * per_page:page * per_page]))
+
+    filters = {"q": q, "partner": partner, "phase": phase, "score": score,
+               "sort": sort, "dir": direction if sort else "",
+               "per_page": per_page if per_page != HISTORY_PER_PAGE else ""}
+
+    def history_url(**changes):
+        params = {k: v for k, v in {**filters, **changes}.items() if v not in ("", "all", None)}
+        return "/history" + ("?" + urlencode(params) if params else "")
+
+    sort_urls = {
+        col: history_url(sort=col, dir="desc" if col == sort and direction == "asc" else "asc")
+        for col in _HISTORY_COLUMNS
+    }
+    stats = {"total": index.length, "passing": index.passing, "needs_work": index.length - index.passing}
+    return render_template(
+        _HISTORY_TEMPLATE, rows_html=rows_html, partners=index.partners, stats=stats,
+        filters=filters, filtered_total=len(matches), page=page, pages=pages,
+        prev_url=history_url(page=page - 1) if page > 1 else None,
+        next_url=history_url(page=page + 1) if page < pages else None,
+        sort_columns=[(col, label) for col, (label, _) in _HISTORY_COLUMNS.items()],
+        sort_urls=sort_urls, phase_options=_HISTORY_PHASE_OPTIONS,
+        score_options=_HISTORY_SCORE_OPTIONS, **ASSET_CONTEXT,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -1730,15 +2162,17 @@ def api_scan_stream():
                 db_save_scan(scan_meta, html_report, json_report_data)
             except Exception as e:
                 print(f"[DB] Error saving scan: {e}")
+            try:
+                _cache_report(report_filename, "html", html_report)
+            except Exception as e:
+                print(f"[CACHE] Could not cache report {report_filename}: {e}")
 
             # Save to filesystem
             try:
                 report_path = os.path.join(REPORTS_DIR, report_filename)
                 with open(report_path, "w", encoding="utf-8") as f:
                     f.write(html_report)
-                json_path = os.path.join(REPORTS_DIR, json_filename)
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(json_report_data, f, indent=2, default=str)
+                _write_json_report(os.path.join(REPORTS_DIR, json_filename), json_report_data)
             except OSError as e:
                 print(f"[FS] Could not write report files: {e}")
 
@@ -1768,9 +2202,19 @@ def api_scan_stream():
     })
 
 
+# /api/scan jobs run one at a time on this pool (the pool is the queue); job_id -> Future.
+# Job status lives in this process only: it is lost on restart and not shared between workers.
+_scan_jobs = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan-job")
+_scan_job_futures: dict = {}
+_scan_job_lock = threading.Lock()
+_MAX_SCAN_JOBS = 100  # finished jobs kept for polling before the oldest are dropped
+_MAX_PENDING_SCAN_JOBS = 10  # queued + running jobs; further submissions get 503
+_SCAN_JOB_WAIT = 900  # seconds a job waits for a browser-started scan before giving up
+
+
 @app.route("/api/scan", methods=["POST"])
 def api_scan():
-    """Run a QA scan. Called by the web UI form."""
+    """Queue a QA scan for programmatic callers. Returns 202 with a job_id to poll."""
     data = request.get_json() or {}
     site_url = data.get("site_url", "").strip()
     partner = data.get("partner", "independent").strip().lower()
@@ -1786,83 +2230,122 @@ def api_scan():
     if _is_self_scan(site_url):
         return jsonify({"success": False, "error": SELF_SCAN_ERROR}), 400
 
+    job_id = uuid.uuid4().hex
+    with _scan_job_lock:
+        if sum(1 for f in _scan_job_futures.values() if not f.done()) >= _MAX_PENDING_SCAN_JOBS:
+            return jsonify({"success": False, "error": "Scan queue is full. Please try again later."}), 503
+        _scan_job_futures[job_id] = _scan_jobs.submit(_run_scan_job, site_url, partner, phase, wrike_task_id)
+        if len(_scan_job_futures) > _MAX_SCAN_JOBS:
+            for old_id in [j for j, f in _scan_job_futures.items() if f.done()][:len(_scan_job_futures) - _MAX_SCAN_JOBS]:
+                del _scan_job_futures[old_id]
+
+    return jsonify({"success": True, "job_id": job_id, "status_url": f"/api/scan/{job_id}"}), 202
+
+
+@app.route("/api/scan/<job_id>", methods=["GET"])
+def api_scan_status(job_id):
+    """Poll a queued scan: state is queued, running, done (with results), busy or error."""
+    with _scan_job_lock:
+        future = _scan_job_futures.get(job_id)
+    if future is None:
+        return jsonify({"success": False, "error": "Unknown job_id"}), 404
+    if not future.done():
+        return jsonify({"success": True, "state": "running" if future.running() else "queued"})
     try:
-        report = run_scan(site_url, partner, phase)
-        report.scan_id = _get_scan_id(site_url, phase)
+        return jsonify({"success": True, "state": "done", **future.result()})
+    except ScanBusyError as e:
+        return jsonify({"success": False, "state": "busy", "error": str(e)})
+    except Exception as e:
+        return jsonify({"success": False, "state": "error", "error": str(e)})
 
-        # Save HTML report
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = site_url.replace("https://", "").replace("http://", "").replace("/", "_").replace(".", "-")
-        report_filename = f"{safe_name}_{timestamp}.html"
-        report_path = os.path.join(REPORTS_DIR, report_filename)
 
-        # Set filename on report so it's available in the generated HTML for API calls
-        report.report_filename = report_filename
-        html_report = generate_html_report(report)
-        json_filename = f"{safe_name}_{timestamp}.json"
-        json_report_data = generate_json_report(report)
-
-        # Save to database (primary persistence)
-        scan_meta = {
-            "scan_id": report.scan_id,
-            "site_url": site_url,
-            "partner": partner,
-            "phase": phase,
-            "score": report.score,
-            "scan_time": report.scan_time,
-            "pages_scanned": report.pages_scanned,
-            "total_checks": report.total_checks,
-            "passed": report.passed,
-            "failed": report.failed,
-            "warnings": report.warnings,
-            "human_review": report.human_review,
-            "report_filename": report_filename,
-        }
-        try:
-            db_save_scan(scan_meta, html_report, json_report_data)
-        except Exception as e:
-            print(f"[DB] Error saving scan: {e}")
+class ScanBusyError(RuntimeError):
+    """Raised by a queued /api/scan job when a browser-started scan holds _scan_semaphore too long."""
 
-        # Save to filesystem (fallback / local dev)
-        try:
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(html_report)
-            json_path = os.path.join(REPORTS_DIR, json_filename)
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(json_report_data, f, indent=2, default=str)
-        except OSError as e:
-            print(f"[FS] Could not write report files: {e}")
 
-        # Add to in-memory history (replaces previous scan with same ID)
-        _add_to_scan_history({
-            "scan_id": report.scan_id,
-            "site_url": site_url,
-            "partner": partner,
-            "phase": phase,
-            "score": report.score,
-            "scan_time": report.scan_time,
-            "report_file": report_filename,
-            "_json_file": json_filename,
-        })
+def _run_scan_job(site_url: str, partner: str, phase: str, wrike_task_id: str = "") -> dict:
+    """Run a scan for /api/scan, save the reports, and return the result summary."""
+    # Only one scan fits in 512MB. Jobs already run one at a time on _scan_jobs, so this
+    # only ever waits behind a browser-started scan; the timeout bounds that wait.
+    if not _scan_semaphore.acquire(timeout=_SCAN_JOB_WAIT):
+        raise ScanBusyError("Timed out waiting for a running scan to finish. Please try again.")
+    try:
+        report = run_scan(site_url, partner, phase)
+    finally:
+        _scan_semaphore.release()
+    report.scan_id = _get_scan_id(site_url, phase)
+
+    # Save HTML report
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    safe_name = site_url.replace("https://", "").replace("http://", "").replace("/", "_").replace(".", "-")
+    report_filename = f"{safe_name}_{timestamp}.html"
+    report_path = os.path.join(REPORTS_DIR, report_filename)
+
+    # Set filename on report so it's available in the generated HTML for API calls
+    report.report_filename = report_filename
+    html_report = generate_html_report(report)
+    json_filename = f"{safe_name}_{timestamp}.json"
+    json_report_data = generate_json_report(report)
+
+    # Save to database (primary persistence)
+    scan_meta = {
+        "scan_id": report.scan_id,
+        "site_url": site_url,
+        "partner": partner,
+        "phase": phase,
+        "score": report.score,
+        "scan_time": report.scan_time,
+        "pages_scanned": report.pages_scanned,
+        "total_checks": report.total_checks,
+        "passed": report.passed,
+        "failed": report.failed,
+        "warnings": report.warnings,
+        "human_review": report.human_review,
+        "report_filename": report_filename,
+    }
+    try:
+        db_save_scan(scan_meta, html_report, json_report_data)
+    except Exception as e:
+        print(f"[DB] Error saving scan: {e}")
+    try:
+        _cache_report(report_filename, "html", html_report)
+    except Exception as e:
+        print(f"[CACHE] Could not cache report {report_filename}: {e}")
 
-        # Post to Wrike if task ID provided
-        if wrike_task_id and WRIKE_API_TOKEN:
-            comment = generate_wrike_comment(report)
-            wrike_post_comment(wrike_task_id, comment)
-
-        return jsonify({
-            "success": True,
-            "score": report.score,
-            "passed": report.passed,
-            "failed": report.failed,
-            "warnings": report.warnings,
-            "human_review": report.human_review,
-            "report_url": f"/reports/{report_filename}",
-            "report_file": report_filename,
-        })
+    # Save to filesystem (fallback / local dev)
+    try:
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(html_report)
+        _write_json_report(os.path.join(REPORTS_DIR, json_filename), json_report_data)
+    except OSError as e:
+        print(f"[FS] Could not write report files: {e}")
+
+    # Add to in-memory history (replaces previous scan with same ID)
+    _add_to_scan_history({
+        "scan_id": report.scan_id,
+        "site_url": site_url,
+        "partner": partner,
+        "phase": phase,
+        "score": report.score,
+        "scan_time": report.scan_time,
+        "report_file": report_filename,
+        "_json_file": json_filename,
+    })
 
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    # Post to Wrike if task ID provided
+    if wrike_task_id and WRIKE_API_TOKEN:
+        comment = generate_wrike_comment(report)
+        wrike_post_comment(wrike_task_id, comment)
+
+    return {
+        "score": report.score,
+        "passed": report.passed,
+        "failed": report.failed,
+        "warnings": report.warnings,
+        "human_review": report.human_review,
+        "report_url": f"/reports/{report_filename}",
+        "report_file": report_filename,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -2113,6 +2596,10 @@ def _process_wrike_task(task_id: str):
             }, html_report, json_report_data)
         except Exception as e:
             print(f"[DB] Error saving Wrike scan: {e}")
+        try:
+            _cache_report(report_filename, "html", html_report)
+        except Exception as e:
+            print(f"[CACHE] Could not cache report {report_filename}: {e}")
 
         # Save to filesystem
         try:
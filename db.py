@@ -6,9 +6,18 @@ Falls back gracefully when DATABASE_URL is not set (local dev).
 
 import os
 import json
+import sqlite3
+import threading
+import time
 from datetime import datetime
 from contextlib import contextmanager
 
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 try:
     import psycopg2
     from psycopg2.extras import RealDictCursor
@@ -18,12 +27,35 @@ except ImportError:
 
 DATABASE_URL = os.environ.get("DATABASE_URL", "")
 
+# The full scan history is reused until this process writes a scan or the TTL
+# passes (the TTL picks up writes made by other instances sharing the database)
+HISTORY_CACHE_TTL = float(os.environ.get("HISTORY_CACHE_TTL", "30"))
+_history_cache = None  # (generation, loaded_at, rows)
+_history_generation = 0
+_history_cache_lock = threading.Lock()
+
 
 def is_db_available() -> bool:
     """Check if database is configured and psycopg2 is installed."""
     return bool(DATABASE_URL) and _HAS_PSYCOPG2
 
 
+def _invalidate_history_cache():
+    """Drop the cached scan history after a write to the scans table."""
+    global _history_cache, _history_generation
+    with _history_cache_lock:
+        _history_generation += 1
+        _history_cache = None
+
+
+def _dumps_report_json(report: dict) -> str:
+    """Serialize a JSON audit report for the report_json column."""
+    if _HAS_ORJSON:
+        return orjson.dumps(report, default=str, option=orjson.OPT_NON_STR_KEYS
+                            | orjson.OPT_PASSTHROUGH_DATETIME).decode()
+    return json.dumps(report, default=str)
+
+
 @contextmanager
 def get_connection():
     """Context manager for database connections."""
@@ -111,6 +143,7 @@ def db_clear_all():
             with conn.cursor() as cur:
                 cur.execute("TRUNCATE TABLE scans, scan_id_map, human_reviews RESTART IDENTITY CASCADE")
                 cur.execute("ALTER SEQUENCE scan_id_seq RESTART WITH 1")
+        _invalidate_history_cache()
         print("[DB] Cleared all scan data and reset sequence to 1")
         return True
     except Exception as e:
@@ -183,30 +216,51 @@ def db_save_scan(scan_meta: dict, html_report: str, json_report: dict):
             """, {
                 **scan_meta,
                 "report_html": html_report,
-                "report_json": json.dumps(json_report, default=str),
+                "report_json": _dumps_report_json(json_report),
             })
+    _invalidate_history_cache()
 
 
-def db_load_scan_history() -> list | None:
-    """Load all scan history from the database.
+def db_load_scan_history(limit: int | None = None, offset: int = 0) -> list | None:
+    """Load scan history from the database, oldest scan ID first.
 
+    With a limit, only the newest `limit` scan IDs (after skipping `offset`) are
+    fetched, still returned oldest first.
     Returns list of dicts matching the scan_history format, or None if DB unavailable.
+    The full history (no limit) is served from a short-lived cache; callers get the
+    same list object until it is invalidated, so treat it as read-only.
     """
+    global _history_cache
     if not is_db_available():
         return None
 
+    if limit is None:
+        with _history_cache_lock:
+            cached, generation = _history_cache, _history_generation
+        if cached and cached[0] == generation and time.monotonic() - cached[1] < HISTORY_CACHE_TTL:
+            return cached[2]
+
+    latest_per_id = """
+        SELECT DISTINCT ON (scan_id)
+               scan_id, site_url, partner, phase, score,
+               scan_time, report_filename
+        FROM scans
+        ORDER BY scan_id, created_at DESC
+    """
     with get_connection() as conn:
         with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("""
-                SELECT DISTINCT ON (scan_id)
-                       scan_id, site_url, partner, phase, score,
-                       scan_time, report_filename
-                FROM scans
-                ORDER BY scan_id, created_at DESC
-            """)
-            rows = cur.fetchall()
-
-    return [
+            if limit is None:
+                cur.execute(latest_per_id)
+                rows = cur.fetchall()
+            else:
+                cur.execute(
+                    f"SELECT * FROM ({latest_per_id}) latest "
+                    "ORDER BY scan_id DESC LIMIT %s OFFSET %s",
+                    (limit, offset),
+                )
+                rows = cur.fetchall()[::-1]
+
+    history = [
         {
             "scan_id": row["scan_id"],
             "site_url": row["site_url"],
@@ -220,6 +274,12 @@ def db_load_scan_history() -> list | None:
         }
         for row in rows
     ]
+    if limit is None:
+        # Only keep the result if no write landed while the query was running
+        with _history_cache_lock:
+            if generation == _history_generation:
+                _history_cache = (generation, time.monotonic(), history)
+    return history
 
 
 def db_get_report(filename: str, report_type: str = "html") -> str | None:
@@ -249,7 +309,8 @@ def db_seed_from_filesystem(reports_dir: str):
 
     Reads JSON audit files and their paired HTML reports from the reports/
     directory and inserts them into the database. Skips files already imported.
-    Also seeds scan_id_map from scan_counter.json.
+    Also seeds scan_id_map from the local scan ID store (scan_counter.sqlite,
+    or the older scan_counter.json).
     """
     if not is_db_available():
         return
@@ -316,13 +377,10 @@ def db_seed_from_filesystem(reports_dir: str):
     if imported:
         print(f"[DB] Imported {imported} scan(s) from filesystem")
 
-    # Seed scan_id_map from scan_counter.json
-    counter_path = os.path.join(reports_dir, "scan_counter.json")
-    if os.path.exists(counter_path):
+    # Seed scan_id_map from the local scan ID store
+    mapping = _load_local_scan_ids(reports_dir)
+    if mapping:
         try:
-            with open(counter_path, "r") as f:
-                counter_data = json.load(f)
-            mapping = counter_data.get("mapping", {})
             max_num = 0
             with get_connection() as conn:
                 with conn.cursor() as cur:
@@ -338,8 +396,7 @@ def db_seed_from_filesystem(reports_dir: str):
                     # Advance sequence past existing IDs
                     if max_num > 0:
                         cur.execute("SELECT setval('scan_id_seq', %s, true)", (max_num,))
-            if mapping:
-                print(f"[DB] Seeded scan_id_map with {len(mapping)} entries, sequence at {max_num}")
+            print(f"[DB] Seeded scan_id_map with {len(mapping)} entries, sequence at {max_num}")
         except Exception as e:
             print(f"[DB] Could not seed scan_id_map: {e}")
 
@@ -355,6 +412,7 @@ def db_update_scan_score(report_filename: str, new_score: int) -> bool:
                     "UPDATE scans SET score = %s WHERE report_filename = %s",
                     (new_score, report_filename)
                 )
+        _invalidate_history_cache()
         return True
     except Exception as e:
         print(f"[DB] Error updating scan score: {e}")
@@ -433,3 +491,27 @@ def db_load_human_reviews(report_filename: str) -> list[dict] | None:
     except Exception as e:
         print(f"[DB] Error loading human reviews: {e}")
         return None
+
+
+def _load_local_scan_ids(reports_dir: str) -> dict:
+    """Read the site_key -> scan_id mapping kept by the filesystem fallback."""
+    mapping = {}
+    counter_path = os.path.join(reports_dir, "scan_counter.json")
+    if os.path.exists(counter_path):
+        try:
+            with open(counter_path, "r") as f:
+                mapping.update(json.load(f).get("mapping", {}))
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[DB] Could not read {counter_path}: {e}")
+
+    counter_db = os.path.join(reports_dir, "scan_counter.sqlite")
+    if os.path.exists(counter_db):
+        try:
+            conn = sqlite3.connect(counter_db)
+            try:
+                mapping.update(conn.execute("SELECT key, scan_id FROM scan_ids"))
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            print(f"[DB] Could not read {counter_db}: {e}")
+    return mapping
@@ -0,0 +1,23 @@
+"""
+Zero-Touch QA - Gunicorn configuration
+Used by the Dockerfile and Procfile:
+    gunicorn -c gunicorn_conf.py app:app
+
+One worker process only: scan history, the scan semaphore and the Chromium
+browser all live in that process, and Render's 512MB limit has no room for a
+second copy. Extra threads let webhooks, report views and the home page be
+served while a scan (which can hold a request open for minutes) is running.
+Scans themselves are still limited to one at a time by _scan_semaphore.
+
+gevent workers are not used: Playwright's sync API runs its own greenlet/asyncio
+loop and does not work under gevent's monkey-patching.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = 1
+worker_class = "gthread"
+threads = max(1, int(os.environ.get("WEB_THREADS", "4")))
+timeout = 600
+graceful_timeout = 10
@@ -104,6 +104,14 @@ def _get_data_uri(path: str, mime: str = "image/png") -> str:
         return ""
 
 
+def _group_by_status(results) -> dict:
+    """Bucket results by status in one pass, keeping scan order within each bucket."""
+    groups = {"PASS": [], "FAIL": [], "WARN": [], "HUMAN_REVIEW": [], "SKIP": []}
+    for r in results:
+        groups.setdefault(r.status, []).append(r)
+    return groups
+
+
 def generate_html_report(report) -> str:
     """Generate a polished, professional HTML report."""
     global _collapse_counter
@@ -120,15 +128,19 @@ def generate_html_report(report) -> str:
         header_bg_css = "linear-gradient(135deg, #1e1b4b 0%, #312e81 30%, #4f46e5 70%, #6366f1 100%)"
 
     # Count by status
-    passed = sum(1 for r in report.results if r.status == "PASS")
-    failed = sum(1 for r in report.results if r.status == "FAIL")
-    warnings = sum(1 for r in report.results if r.status == "WARN")
-    human_review = sum(1 for r in report.results if r.status == "HUMAN_REVIEW")
-    skipped = sum(1 for r in report.results if r.status == "SKIP")
+    by_status = _group_by_status(report.results)
+    failures = by_status["FAIL"]
+    warns = by_status["WARN"]
+    humans = by_status["HUMAN_REVIEW"]
+    passed = len(by_status["PASS"])
+    failed = len(failures)
+    warnings = len(warns)
+    human_review = len(humans)
+    skipped = len(by_status["SKIP"])
 
     # Check for any failures - "Ready for Delivery" requires zero failures
     has_failures = failed > 0
-    critical_failures = [r for r in report.results if r.status == "FAIL" and r.weight >= 5]
+    critical_failures = [r for r in failures if r.weight >= 5]
     has_critical = len(critical_failures) > 0
 
     # Score color & assessment
@@ -218,7 +230,6 @@ def generate_html_report(report) -> str:
 
     # Build failures section
     failures_html = ""
-    failures = [r for r in report.results if r.status == "FAIL"]
     if failures:
         for r in failures:
             headline = _get_issue_headline(r.details, r.check)
@@ -241,7 +252,6 @@ def generate_html_report(report) -> str:
 
     # Build warnings section
     warnings_html = ""
-    warns = [r for r in report.results if r.status == "WARN"]
     if warns:
         for r in warns:
             headline = _get_issue_headline(r.details, r.check)
@@ -263,7 +273,6 @@ def generate_html_report(report) -> str:
 
     # Build human review section
     human_html = ""
-    humans = [r for r in report.results if r.status == "HUMAN_REVIEW"]
     total_human_weight = sum(r.weight for r in humans)
     if humans:
         for idx, r in enumerate(humans):
@@ -991,7 +1000,7 @@ var circumference = 2 * Math.PI * 54;
 var totalHumanItems = {human_review};
 var humanStatuses = {{}};
 var reportFilename = '{getattr(report, "report_filename", "")}';
-var ruleIds = {json.dumps([r.rule_id for r in report.results if r.status == "HUMAN_REVIEW"])};
+var ruleIds = {json.dumps([r.rule_id for r in humans])};
 
 // Initialize all human review items as null (not yet reviewed)
 for (var i = 0; i < totalHumanItems; i++) {{ humanStatuses[i] = null; }}
@@ -1235,9 +1244,10 @@ if (document.readyState === 'loading') {{
 
 def generate_wrike_comment(report) -> str:
     """Generate a formatted comment suitable for posting to a Wrike task."""
-    failures = [r for r in report.results if r.status == "FAIL"]
-    warns = [r for r in report.results if r.status == "WARN"]
-    humans = [r for r in report.results if r.status == "HUMAN_REVIEW"]
+    by_status = _group_by_status(report.results)
+    failures = by_status["FAIL"]
+    warns = by_status["WARN"]
+    humans = by_status["HUMAN_REVIEW"]
 
     lines = []
     lines.append(f"<b>Zero-Touch QA Scan Complete</b>")
@@ -6,6 +6,7 @@ Rules can be edited via the web UI at /rules/edit -- no coding required.
 
 import json
 import os
+import functools
 
 _RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rules.json")
 
@@ -25,6 +26,15 @@ def _save_rules(data: dict):
     """Save rules back to the JSON file."""
     with open(_RULES_FILE, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2)
+    _rules_for_scan.cache_clear()
+
+
+def _rules_mtime() -> int:
+    """rules.json modification time, so hand edits to the file also invalidate the cache."""
+    try:
+        return os.stat(_RULES_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return 0
 
 
 def get_all_rules() -> dict:
@@ -35,9 +45,17 @@ def get_all_rules() -> dict:
 def get_rules_for_scan(partner: str, phase: str) -> list:
     """
     Returns the combined list of rules applicable to a given partner and build phase.
+
+    The memoized rules are shared by every scan, so each call gets shallow copies:
+    a caller may set keys on a rule without affecting later scans. Nested values
+    (e.g. the phase lists) are still shared and must be treated as read-only.
     """
-    partner = partner.lower().strip()
-    phase = phase.lower().strip()
+    return [dict(rule) for rule in _rules_for_scan(partner.lower().strip(), phase.lower().strip(), _rules_mtime())]
+
+
+@functools.lru_cache(maxsize=64)
+def _rules_for_scan(partner: str, phase: str, mtime_ns: int) -> tuple:
+    """Cached body of get_rules_for_scan; cleared by _save_rules."""
     data = _load_rules()
 
     applicable = []
@@ -52,7 +70,7 @@ def get_rules_for_scan(partner: str, phase: str) -> list:
         if phase in rule.get("phase", []):
             applicable.append(rule)
 
-    return applicable
+    return tuple(applicable)
 
 
 def get_automatable_rules(rules: list) -> list:
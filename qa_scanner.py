@@ -12,6 +12,7 @@ import re
 import json
 import time
 import urllib.parse
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -630,12 +631,15 @@ class SiteCrawler:
         WP Engine / hosting provider rate-limiting.
         """
         CRAWL_DELAY = 0.5  # seconds between page fetches
-        queue = [self.base_url]
+        # FIFO frontier plus a set of everything ever queued: O(1) pops and
+        # membership tests instead of list.pop(0) / `link in queue` scans
+        queue = deque([self.base_url])
+        queued = {self.base_url}
         crawled = 0
 
         try:
             while queue and crawled < max_pages:
-                url = queue.pop(0)
+                url = queue.popleft()
                 normalized = self._normalize_url(url)
 
                 if not self._is_crawlable(normalized) or normalized in self.visited:
@@ -650,7 +654,8 @@ class SiteCrawler:
                     crawled += 1
                     print(f"  [{crawled}/{max_pages}] {page.status_code} - {normalized}")
                     for link in self._collect_links(page):
-                        if link not in queue:
+                        if link not in queued:
+                            queued.add(link)
                             queue.append(link)
 
             # Sitemap fallback: if BFS found too few pages, seed queue from sitemap
@@ -658,12 +663,12 @@ class SiteCrawler:
                 sitemap_urls = self._fetch_sitemap_urls()
                 if sitemap_urls:
                     print(f"  [Sitemap] BFS found only {crawled} pages, adding {len(sitemap_urls)} from sitemap")
-                    for surl in sitemap_urls:
-                        queue.append(surl)
+                    queue.extend(sitemap_urls)
+                    queued.update(sitemap_urls)
 
                     # Resume BFS with sitemap-discovered URLs
                     while queue and crawled < max_pages:
-                        url = queue.pop(0)
+                        url = queue.popleft()
                         normalized = self._normalize_url(url)
                         if not self._is_crawlable(normalized) or normalized in self.visited:
                             continue
@@ -674,7 +679,8 @@ class SiteCrawler:
                             crawled += 1
                             print(f"  [{crawled}/{max_pages}] {page.status_code} - {normalized}")
                             for link in self._collect_links(page):
-                                if link not in queue:
+                                if link not in queued:
+                                    queued.add(link)
                                     queue.append(link)
         finally:
             self._cleanup_browser()